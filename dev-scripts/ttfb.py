@@ -10,7 +10,7 @@ import sys
 import time
 from typing import List
 
-import httpx
+import aiohttp
 
 STATE_FILE_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -20,6 +20,7 @@ STATE_FILE_PATH = os.path.join(
 )
 
 TTFB_TIMEOUT_SECONDS = 180.0  # Adjust this value as needed
+STREAM_CHUNK_SIZE = 256 * 1024  # Body read size; hashed incrementally, never buffered
 
 
 def nix_hash_to_hex(hash_str: str) -> str:
@@ -86,9 +87,9 @@ def get_expected_hash_info(info: dict) -> tuple[str, str]:
     return expected_hash, hash_type
 
 
-def verify_nar_hash(content: bytes, info: dict) -> tuple[bool, str, str]:
+def verify_nar_hash(actual_hash: str, info: dict) -> tuple[bool, str, str]:
     """
-    Verify NAR content hash against the narinfo.
+    Verify the hex SHA-256 of the downloaded NAR against the narinfo.
 
     Returns:
         tuple of (passed: bool, expected_hex: str, actual_hash: str)
@@ -101,9 +102,6 @@ def verify_nar_hash(content: bytes, info: dict) -> tuple[bool, str, str]:
     # Parse the expected hash to get hex digest
     expected_hex = nix_hash_to_hex(expected_hash)
 
-    # Compute SHA256 hash of the content
-    actual_hash = hashlib.sha256(content).hexdigest()
-
     # Compare
     passed = actual_hash == expected_hex
     return passed, expected_hex, actual_hash
@@ -121,29 +119,40 @@ def get_urls_from_state_file() -> List[str]:
         return []
 
 
-async def fetch_with_verification(client, base_url, path, narinfo, do_verify: bool):
-    """Fetch NAR and optionally verify its hash."""
+async def fetch_with_verification(
+    session, base_url, path, narinfo, do_verify: bool, ttfb_only: bool = False
+):
+    """Fetch NAR and optionally verify its hash.
+
+    With ttfb_only, the connection is closed as soon as the first body bytes
+    arrive instead of downloading the rest of the NAR.
+    """
     url = f"{base_url}/{path}"
     start_time = time.perf_counter()
     ttfb = None
 
     try:
-        # Use streaming to capture the moment the first byte arrives
-        async with client.stream("GET", url) as response:
-            # aiter_bytes() triggers the read, which is subject to the 'read' timeout
-            content = bytearray()
-            async for chunk in response.aiter_bytes():
-                content.extend(chunk)
+        # Stream the body to capture the moment the first byte arrives
+        async with session.get(url) as response:
+            # Reading triggers the 'sock_read' timeout, i.e. it bounds the TTFB.
+            sha256 = hashlib.sha256()
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
                 if ttfb is None:
                     ttfb = time.perf_counter() - start_time
+                    if ttfb_only:
+                        # Drop the connection rather than drain the body.
+                        response.close()
+                        break
+                if do_verify:
+                    sha256.update(chunk)
 
             total_time = time.perf_counter() - start_time
 
             result = {
                 "url": base_url,
                 "ttfb": f"{ttfb:.4f}s" if ttfb else "N/A",
-                "total": f"{total_time:.4f}s",
-                "status": response.status_code,
+                "total": "n/a" if ttfb_only else f"{total_time:.4f}s",
+                "status": response.status,
                 "hash_passed": None,
                 "expected_hash": "",
                 "actual_hash": "",
@@ -151,13 +160,13 @@ async def fetch_with_verification(client, base_url, path, narinfo, do_verify: bo
 
             # Verify hash if requested
             if do_verify:
-                passed, expected, actual = verify_nar_hash(bytes(content), narinfo)
+                passed, expected, actual = verify_nar_hash(sha256.hexdigest(), narinfo)
                 result["hash_passed"] = "PASSED" if passed else "FAILED"
                 result["expected_hash"] = expected
                 result["actual_hash"] = actual
 
             return result
-    except httpx.TimeoutException:
+    except asyncio.TimeoutError:
         return {
             "url": base_url,
             "error": f"Timeout: No response within {TTFB_TIMEOUT_SECONDS}s",
@@ -182,6 +191,11 @@ async def main():
         action="store_true",
         help="Skip NAR hash verification",
     )
+    parser.add_argument(
+        "--ttfb-only",
+        action="store_true",
+        help="Stop each download at the first byte (implies --no-verify)",
+    )
     args = parser.parse_args()
 
     default_urls = get_urls_from_state_file()
@@ -195,20 +209,28 @@ async def main():
 
     narinfo_url = f"{target_urls[0]}/{args.hash}.narinfo"
 
-    # Define the timeout structure. 'read' specifically limits the TTFB.
-    timeout = httpx.Timeout(connect=5.0, read=TTFB_TIMEOUT_SECONDS, write=5.0, pool=5.0)
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    # Define the timeout structure. 'sock_read' specifically limits the TTFB.
+    timeout = aiohttp.ClientTimeout(sock_connect=5.0, sock_read=TTFB_TIMEOUT_SECONDS)
+    do_verify = not (args.no_verify or args.ttfb_only)
+
+    # One session (and connection pool) is shared by every target. The hash is
+    # over the body as served, so verification needs any Content-Encoding
+    # undone; timing alone can skip that work and read the raw wire bytes.
+    async with aiohttp.ClientSession(
+        timeout=timeout,
+        connector=aiohttp.TCPConnector(limit=0),
+        auto_decompress=do_verify,
+    ) as session:
         # 1. Fetch narinfo from first instance
         try:
-            resp = await client.get(narinfo_url)
-            resp.raise_for_status()
+            async with session.get(narinfo_url, raise_for_status=True) as resp:
+                narinfo_text = await resp.text()
         except Exception as e:
             print(f"Error fetching narinfo: {e}")
             sys.exit(1)
 
         # 2. Parse narinfo fields
-        narinfo = parse_narinfo(resp.text)
+        narinfo = parse_narinfo(narinfo_text)
 
         # 3. Parse URL entry
         nar_path = narinfo.get("URL", "")
@@ -217,7 +239,6 @@ async def main():
             sys.exit(1)
 
         # Print what we're testing
-        do_verify = not args.no_verify
         if do_verify:
             expected_hash, hash_type = get_expected_hash_info(narinfo)
             expected_hex = nix_hash_to_hex(expected_hash)
@@ -225,10 +246,14 @@ async def main():
             print(f"  Expected hash ({hash_type}): {expected_hex}\n")
         else:
             print(f"Testing NAR: {nar_path}")
-            print("  Skipping hash verification (--no-verify)\n")
+            flag = "--ttfb-only" if args.ttfb_only else "--no-verify"
+            print(f"  Skipping hash verification ({flag})\n")
 
         # 4. Call in parallel across all instances with optional verification
-        tasks = [fetch_with_verification(client, url, nar_path, narinfo, do_verify) for url in target_urls]
+        tasks = [
+            fetch_with_verification(session, url, nar_path, narinfo, do_verify, args.ttfb_only)
+            for url in target_urls
+        ]
         results = await asyncio.gather(*tasks)
 
         # 5. Report results
@@ -7,12 +7,17 @@ are needed for connection settings or CDC mode.
 """
 
 import argparse
+import collections
+import functools
 import hashlib
 import io
+import itertools
 import json
+import mmap
 import os
-import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import zstandard as zstd
@@ -21,6 +26,41 @@ from blake3 import blake3
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEFAULT_STATE_FILE = os.path.join(REPO_ROOT, "var", "ncps", "state.json")
 
+# Chunks are independent objects, so their reads (and the GIL-releasing zstd
+# and BLAKE3 work) overlap across a pool; only the SHA-256 over the
+# reconstructed NAR has to consume them in chunk order. The pool is at least
+# one thread per core so CPU-bound local verification saturates the machine,
+# and never fewer than 16 so S3 round trips still overlap on small hosts.
+CHUNK_WORKERS = max(16, os.cpu_count() or 1)
+CHUNK_PREFETCH = 2 * CHUNK_WORKERS
+
+# Decompressed chunks are consumed in blocks of this size so a chunk is never
+# held as both a compressed and a decompressed copy. Both block sizes are
+# multiples of the 64-byte SHA-256 block and large enough to keep OpenSSL's
+# hardware-accelerated (SHA-NI) path amortized across each update() call.
+STREAM_BLOCK_SIZE = 256 * 1024
+FLAT_BLOCK_SIZE = 1024 * 1024
+
+# Chunks at least this large (uncompressed) are BLAKE3-hashed with the
+# library's own thread pool; below it the per-update thread handoff costs more
+# than it saves, and the chunk workers already spread small chunks over cores.
+BLAKE3_THREADED_MIN = 1024 * 1024
+
+# Concurrent stat/HEAD lookups for --sizes-only.
+SIZE_CHECK_WORKERS = 32
+
+# Flat NARs on S3 larger than one part are fetched as concurrent ranged GETs.
+S3_PART_SIZE = 8 * 1024 * 1024
+S3_PART_WORKERS = 8
+
+# Narinfos verified concurrently by default (see --jobs). Each CDC narinfo
+# also fans its chunk reads out over CHUNK_WORKERS threads.
+DEFAULT_JOBS = 4
+
+# Narinfo ids per joined metadata query; keeps the IN (...) list well under
+# every backend's bound-parameter limit (SQLite's default is 999).
+NARINFO_BATCH = 500
+
 
 # ---------------------------------------------------------------------------
 # Argument parsing
@@ -48,7 +88,27 @@ def parse_args():
         metavar="N",
         help="Verify at most N narinfos",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar="N",
+        help=f"Verify up to N narinfos concurrently (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay connected and verify narinfo hashes read from stdin, one per line",
+    )
+    parser.add_argument(
+        "--sizes-only",
+        action="store_true",
+        help="Only compare stored object sizes with the DB (no download or hashing)",
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
 
 
 # ---------------------------------------------------------------------------
@@ -133,18 +193,39 @@ def placeholder(db_type):
 # ---------------------------------------------------------------------------
 
 
-def get_s3_client(s3_cfg):
+def get_s3_client(s3_cfg, max_connections):
     import boto3
+    from botocore.config import Config
 
-    return boto3.client(
+    # boto3.client() shares the module-level default session, which is not
+    # safe to use from several threads at once; give each client its own.
+    # The client is shared by every worker thread, so its connection pool is
+    # sized to match (botocore's default of 10 would make most threads queue).
+    return boto3.session.Session().client(
         "s3",
         endpoint_url=s3_cfg["endpoint"],
         aws_access_key_id=s3_cfg["access_key"],
         aws_secret_access_key=s3_cfg["secret_key"],
         region_name=s3_cfg["region"],
+        config=Config(max_pool_connections=max_connections),
     )
 
 
+_local = threading.local()
+
+
+def decompressor():
+    """
+    Return this thread's ZstdDecompressor. A decompressor must not be used by
+    two threads at once, so each worker keeps one instead of building a new
+    context per chunk.
+    """
+    dctx = getattr(_local, "dctx", None)
+    if dctx is None:
+        dctx = _local.dctx = zstd.ZstdDecompressor()
+    return dctx
+
+
 # ---------------------------------------------------------------------------
 # Path helpers (mirroring NCPS two-level sharding)
 # ---------------------------------------------------------------------------
@@ -168,13 +249,25 @@ def chunk_key(hash_):
 # ---------------------------------------------------------------------------
 
 
-def read_local(storage_path, rel_key):
-    """Read a file from local storage; return bytes or raise."""
+def open_local(storage_path, rel_key):
+    """Map a file from local storage; return (file-like mmap, size) or raise."""
     full = os.path.join(storage_path, rel_key)
     if not os.path.exists(full):
         raise FileNotFoundError(f"Missing file: {full}")
     with open(full, "rb") as f:
-        return f.read()
+        return map_file(f)
+
+
+def map_file(f):
+    """
+    Return (mmap, size) for an open file, read straight from the page cache
+    instead of being copied into a bytes object. Empty files cannot be
+    mapped and come back as an empty memoryview.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        return memoryview(b""), 0
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), size
 
 
 def size_local(storage_path, rel_key):
@@ -185,13 +278,13 @@ def size_local(storage_path, rel_key):
     return os.stat(full).st_size
 
 
-def read_s3(s3, bucket, rel_key):
-    """Read an object from S3; return bytes or raise."""
+def open_s3(s3, bucket, rel_key):
+    """Open an object from S3; return (streaming body, size) or raise."""
     # S3 keys use forward slashes regardless of OS
     key = rel_key.replace(os.sep, "/")
     try:
         obj = s3.get_object(Bucket=bucket, Key=key)
-        return obj["Body"].read()
+        return obj["Body"], obj["ContentLength"]
     except Exception as e:
         raise FileNotFoundError(f"S3 object not found: s3://{bucket}/{key} ({e})")
 
@@ -211,18 +304,40 @@ def size_s3(s3, bucket, rel_key):
 # ---------------------------------------------------------------------------
 
 
+NIX32_ALPHABET = "0123456789abcdfghijklmnpqrsvwxyz"
+NIX32_SHA256_LEN = 52
+
+
 def to_nix32(hex_hash):
-    """Convert a hex SHA-256 hash to Nix base-32 via nix-hash."""
-    try:
-        result = subprocess.run(
-            ["nix-hash", "--type", "sha256", "--to-base32", hex_hash],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except (FileNotFoundError, subprocess.CalledProcessError):
+    """
+    Encode a hex SHA-256 hash as Nix base-32 (the inverse of nix32_to_hex),
+    matching `nix-hash --type sha256 --to-base32`.
+    """
+    n = int.from_bytes(bytes.fromhex(hex_hash), "little")
+    return "".join(
+        NIX32_ALPHABET[(n >> (5 * i)) & 0x1F]
+        for i in range(NIX32_SHA256_LEN - 1, -1, -1)
+    )
+
+
+def nix32_to_hex(nix32):
+    """
+    Decode a Nix base-32 SHA-256 hash to hex; return None if it is not one.
+
+    Nix base-32 is the digest read as a little-endian integer and printed most
+    significant digit first, so decoding is a plain base conversion.
+    """
+    if len(nix32) != NIX32_SHA256_LEN:
         return None
+    n = 0
+    for c in nix32:
+        digit = NIX32_ALPHABET.find(c)
+        if digit < 0:
+            return None
+        n = n * 32 + digit
+    if n >> 256:
+        return None
+    return n.to_bytes(32, "little").hex()
 
 
 def strip_prefix(h):
@@ -239,8 +354,66 @@ def hash_matches(computed_hex, expected_db):
         return False
     if computed_hex == expected:
         return True
-    nix32 = to_nix32(computed_hex)
-    return nix32 is not None and nix32 == expected
+    return nix32_to_hex(expected) == computed_hex
+
+
+# ---------------------------------------------------------------------------
+# Batched metadata lookup
+# ---------------------------------------------------------------------------
+
+
+def fetch_nar_files(cur, db_type, narinfo_ids):
+    """
+    Fetch the nar_files linked to each narinfo, together with their ordered
+    chunk rows, using one joined query per NARINFO_BATCH ids.
+
+    Returns {narinfo_id: [(nar_file, chunks), ...]} where nar_file is a dict of
+    the nar_files columns used here and chunks is a list of dicts with hash,
+    size and compressed_size (empty for non-CDC nar_files).
+    """
+    result = {}
+    ids = iter(narinfo_ids)
+    while batch := list(itertools.islice(ids, NARINFO_BATCH)):
+        marks = ", ".join([placeholder(db_type)] * len(batch))
+        cur.execute(
+            f"""
+            SELECT nnf.narinfo_id, nf.id AS nf_id, nf.hash AS nf_hash,
+                   nf.compression, nf.file_size, nf.total_chunks,
+                   nfc.chunk_index, c.hash AS chunk_hash,
+                   c.size AS chunk_size, c.compressed_size
+            FROM narinfo_nar_files nnf
+            JOIN nar_files nf ON nnf.nar_file_id = nf.id
+            LEFT JOIN nar_file_chunks nfc ON nfc.nar_file_id = nf.id
+            LEFT JOIN chunks c ON nfc.chunk_id = c.id
+            WHERE nnf.narinfo_id IN ({marks})
+            ORDER BY nnf.narinfo_id, nf.id, nfc.chunk_index
+            """,
+            batch,
+        )
+        rows = cur.fetchall()
+        for ni_id, ni_rows in itertools.groupby(rows, key=lambda r: r["narinfo_id"]):
+            nar_files = result.setdefault(ni_id, [])
+            for _, nf_rows in itertools.groupby(ni_rows, key=lambda r: r["nf_id"]):
+                nf_rows = list(nf_rows)
+                first = nf_rows[0]
+                nar_file = {
+                    "id": first["nf_id"],
+                    "hash": first["nf_hash"],
+                    "compression": first["compression"],
+                    "file_size": first["file_size"],
+                    "total_chunks": first["total_chunks"],
+                }
+                chunks = [
+                    {
+                        "hash": r["chunk_hash"],
+                        "size": r["chunk_size"],
+                        "compressed_size": r["compressed_size"],
+                    }
+                    for r in nf_rows
+                    if r["chunk_hash"] is not None
+                ]
+                nar_files.append((nar_file, chunks))
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -248,85 +421,126 @@ def hash_matches(computed_hex, expected_db):
 # ---------------------------------------------------------------------------
 
 
-def verify_cdc(cur, db_type, state, nar_file_id, nar_hash_db, nar_size_db):
+def check_chunk(chunk, open_chunk):
+    """
+    Stream one CDC chunk from open_chunk(key) through zstd, verifying its
+    compressed size, uncompressed size and BLAKE3 hash on the fly.
+
+    The output buffer is allocated once at the DB's uncompressed size and
+    filled in place; any bytes past that size are still hashed and returned
+    so the mismatch is reported rather than hidden.
+
+    Returns (blocks, errors) where blocks are the decompressed buffers in
+    order, or None when the chunk could not be read or decompressed.
+    """
+    chunk_hash = chunk["hash"]
+    expected_compressed_size = chunk["compressed_size"]
+    expected_size = chunk["size"]
+    errors = []
+
+    # --- open compressed stream ---
+    try:
+        src, compressed_size = open_chunk(chunk_key(chunk_hash))
+    except FileNotFoundError as e:
+        return None, [f"Chunk {chunk_hash[:12]}…: {e}"]
+
+    # --- verify compressed size ---
+    if compressed_size != expected_compressed_size:
+        errors.append(
+            f"Chunk {chunk_hash[:12]}…: compressed size mismatch "
+            f"(disk {compressed_size}, DB {expected_compressed_size})"
+        )
+
+    # --- decompress, hashing each block as it is produced ---
+    if expected_size >= BLAKE3_THREADED_MIN:
+        b3 = blake3(max_threads=blake3.AUTO)
+    else:
+        b3 = blake3()
+    view = memoryview(bytearray(expected_size))
+    size = 0
+    try:
+        with decompressor().stream_reader(src) as reader:
+            while size < expected_size:
+                n = reader.readinto(view[size : size + STREAM_BLOCK_SIZE])
+                if not n:
+                    break
+                b3.update(view[size : size + n])
+                size += n
+            blocks = [view[:size]]
+            while extra := reader.read(STREAM_BLOCK_SIZE):
+                b3.update(extra)
+                blocks.append(extra)
+                size += len(extra)
+    except zstd.ZstdError as e:
+        errors.append(f"Chunk {chunk_hash[:12]}…: zstd decompression failed: {e}")
+        return None, errors
+    except Exception as e:
+        # The S3 body is streamed here, not in open_chunk, so a dropped or
+        # timed-out read surfaces mid-loop; report it against this chunk
+        # rather than let it abort the whole run.
+        errors.append(f"Chunk {chunk_hash[:12]}…: read failed: {e}")
+        return None, errors
+
+    # --- verify uncompressed size ---
+    if size != expected_size:
+        errors.append(
+            f"Chunk {chunk_hash[:12]}…: uncompressed size mismatch "
+            f"(got {size}, DB {expected_size})"
+        )
+
+    # --- verify BLAKE3 hash ---
+    computed_b3 = b3.hexdigest()
+    if computed_b3 != chunk_hash:
+        errors.append(
+            f"Chunk {chunk_hash[:12]}…: BLAKE3 mismatch "
+            f"(got {computed_b3[:12]}…, expected {chunk_hash[:12]}…)"
+        )
+
+    return blocks, errors
+
+
+def verify_cdc(state, s3, chunks, nar_hash_db, nar_size_db):
     """
-    Reconstruct the NAR from its CDC chunks, verify BLAKE3 per chunk and
-    SHA-256 of the full reconstructed NAR against nar_hash_db.
+    Reconstruct the NAR from its CDC chunks (as returned by fetch_nar_files),
+    verify BLAKE3 per chunk and SHA-256 of the full reconstructed NAR against
+    nar_hash_db.
+
+    Chunks are read and checked by a thread pool up to CHUNK_PREFETCH ahead of
+    the in-order SHA-256 consumer.
 
     Returns list of error strings (empty = pass).
     """
-    p = placeholder(db_type)
-    cur.execute(
-        f"""
-        SELECT nfc.chunk_index, c.hash, c.size, c.compressed_size
-        FROM nar_file_chunks nfc
-        JOIN chunks c ON nfc.chunk_id = c.id
-        WHERE nfc.nar_file_id = {p}
-        ORDER BY nfc.chunk_index
-        """,
-        (nar_file_id,),
-    )
-    chunks = cur.fetchall()
     if not chunks:
         return ["CDC: no chunks found in nar_file_chunks (expected > 0)"]
 
     errors = []
     sha256 = hashlib.sha256()
     total_size = 0
-    dctx = zstd.ZstdDecompressor()
 
     storage = state["storage"]
     storage_path = state.get("storage_path", "")
-    s3 = get_s3_client(state["s3"]) if storage == "s3" else None
-    bucket = state["s3"]["bucket"] if storage == "s3" else ""
-
-    for chunk in chunks:
-        chunk_hash = chunk["hash"]
-        expected_compressed_size = chunk["compressed_size"]
-        expected_size = chunk["size"]
-        key = chunk_key(chunk_hash)
-
-        # --- read compressed bytes ---
-        try:
-            if storage == "local":
-                compressed = read_local(storage_path, key)
-            else:
-                compressed = read_s3(s3, bucket, key)
-        except FileNotFoundError as e:
-            errors.append(f"Chunk {chunk_hash[:12]}…: {e}")
-            continue
-
-        # --- verify compressed size ---
-        if len(compressed) != expected_compressed_size:
-            errors.append(
-                f"Chunk {chunk_hash[:12]}…: compressed size mismatch "
-                f"(disk {len(compressed)}, DB {expected_compressed_size})"
-            )
-
-        # --- decompress ---
-        try:
-            data = dctx.decompress(compressed)
-        except zstd.ZstdError as e:
-            errors.append(f"Chunk {chunk_hash[:12]}…: zstd decompression failed: {e}")
-            continue
-
-        # --- verify uncompressed size ---
-        if len(data) != expected_size:
-            errors.append(
-                f"Chunk {chunk_hash[:12]}…: uncompressed size mismatch "
-                f"(got {len(data)}, DB {expected_size})"
-            )
-
-        # --- verify BLAKE3 hash ---
-        computed_b3 = blake3(data).hexdigest()
-        if computed_b3 != chunk_hash:
-            errors.append(
-                f"Chunk {chunk_hash[:12]}…: BLAKE3 mismatch "
-                f"(got {computed_b3[:12]}…, expected {chunk_hash[:12]}…)"
-            )
+    if storage == "local":
+        open_chunk = functools.partial(open_local, storage_path)
+    else:
+        # boto3 clients are thread-safe, so the workers share this one.
+        open_chunk = functools.partial(open_s3, s3, state["s3"]["bucket"])
+
+    with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as pool:
+        remaining = iter(chunks)
+        pending = collections.deque(
+            pool.submit(check_chunk, chunk, open_chunk)
+            for chunk in itertools.islice(remaining, CHUNK_PREFETCH)
+        )
+        while pending:
+            blocks, chunk_errors = pending.popleft().result()
+            nxt = next(remaining, None)
+            if nxt is not None:
+                pending.append(pool.submit(check_chunk, nxt, open_chunk))
 
-        sha256.update(data)
-        total_size += len(data)
+            errors.extend(chunk_errors)
+            for block in blocks or ():
+                sha256.update(block)
+                total_size += len(block)
 
     if errors:
         return errors
@@ -355,7 +569,20 @@ def verify_cdc(cur, db_type, state, nar_file_id, nar_hash_db, nar_size_db):
 # ---------------------------------------------------------------------------
 
 
-def verify_flat(state, nar_file_hash, compression, file_size_db, file_hash_db):
+class HashingSink:
+    """Write-only, non-seekable file object that SHA-256s and counts its input."""
+
+    def __init__(self):
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+        return len(data)
+
+
+def verify_flat(state, s3, nar_file_hash, compression, file_size_db, file_hash_db):
     """
     Read the compressed NAR file from disk or S3, verify its size and SHA-256
     against file_size_db and file_hash_db.
@@ -367,27 +594,39 @@ def verify_flat(state, nar_file_hash, compression, file_size_db, file_hash_db):
 
     storage = state["storage"]
     storage_path = state.get("storage_path", "")
-    s3 = get_s3_client(state["s3"]) if storage == "s3" else None
     bucket = state["s3"]["bucket"] if storage == "s3" else ""
 
     # --- verify physical size and SHA-256 ---
-    sha256 = hashlib.sha256()
-    actual_size = 0
+    sink = HashingSink()
     try:
         if storage == "local":
             full = os.path.join(storage_path, key)
             with open(full, "rb") as f:
-                while chunk := f.read(65536):
-                    sha256.update(chunk)
-                    actual_size += len(chunk)
+                data, _ = map_file(f)
+            with data, memoryview(data) as view:
+                for offset in range(0, len(view), FLAT_BLOCK_SIZE):
+                    sink.write(view[offset : offset + FLAT_BLOCK_SIZE])
         else:
-            obj = s3.get_object(Bucket=bucket, Key=key.replace(os.sep, "/"))
-            for chunk in obj["Body"].iter_chunks(chunk_size=65536):
-                sha256.update(chunk)
-                actual_size += len(chunk)
+            from boto3.s3.transfer import TransferConfig
+
+            # The transfer manager splits large objects into concurrent ranged
+            # GETs; because the sink is not seekable it hands the parts back
+            # in order, so they can be hashed as they arrive.
+            s3.download_fileobj(
+                bucket,
+                key.replace(os.sep, "/"),
+                sink,
+                Config=TransferConfig(
+                    multipart_threshold=S3_PART_SIZE,
+                    multipart_chunksize=S3_PART_SIZE,
+                    max_concurrency=S3_PART_WORKERS,
+                ),
+            )
     except Exception as e:
         return [str(e)]
 
+    sha256 = sink.sha256
+    actual_size = sink.size
     if actual_size != file_size_db:
         errors.append(
             f"File size mismatch (disk {actual_size}, DB file_size={file_size_db})"
@@ -406,6 +645,192 @@ def verify_flat(state, nar_file_hash, compression, file_size_db, file_hash_db):
     return errors
 
 
+# ---------------------------------------------------------------------------
+# Size-only verification
+# ---------------------------------------------------------------------------
+
+
+def verify_sizes_only(state, s3, expected):
+    """
+    Cheap first pass: stat (local) or HEAD (S3) every object in expected, a
+    list of (rel_key, size_db) pairs, and compare the stored size with the DB.
+    Lookups run on a SIZE_CHECK_WORKERS pool since S3 HEADs are RTT-bound.
+
+    Returns list of error strings (empty = pass).
+    """
+    if state["storage"] == "local":
+        size_of = functools.partial(size_local, state.get("storage_path", ""))
+    else:
+        size_of = functools.partial(size_s3, s3, state["s3"]["bucket"])
+
+    def check(item):
+        rel_key, size_db = item
+        try:
+            size = size_of(rel_key)
+        except FileNotFoundError as e:
+            return str(e)
+        if size != size_db:
+            return f"Size mismatch for {rel_key} (stored {size}, DB {size_db})"
+        return None
+
+    with ThreadPoolExecutor(max_workers=SIZE_CHECK_WORKERS) as pool:
+        return [e for e in pool.map(check, expected) if e is not None]
+
+
+# ---------------------------------------------------------------------------
+# Per-narinfo verification
+# ---------------------------------------------------------------------------
+
+
+def verify_narinfo(state, s3, ni, nar_files, sizes_only=False):
+    """
+    Verify every nar_file linked to one narinfo. With sizes_only, only the
+    stored object sizes are checked (see verify_sizes_only).
+
+    Returns (lines, failures): the report lines for this narinfo, buffered so
+    parallel workers' output is printed whole and in narinfo order, and the
+    number of failed checks.
+    """
+    cdc_enabled = state.get("cdc", False)
+    ni_hash = ni["hash"]
+    store_path = ni["store_path"] or "(unknown)"
+
+    out = [f"[{ni_hash}]  {store_path}"]
+    failures = 0
+
+    if not nar_files:
+        out += ["  [FAIL] No linked nar_file found in narinfo_nar_files", ""]
+        return out, 1
+
+    for nf, chunks in nar_files:
+        nf_id = nf["id"]
+        total_chunks = nf["total_chunks"]
+        nf_hash = nf["hash"]
+        nf_compression = nf["compression"] or ""
+        nf_file_size = nf["file_size"]
+
+        if cdc_enabled:
+            # Expect chunks; absence is a failure
+            if total_chunks == 0:
+                out.append(
+                    f"  [FAIL] CDC enabled but nar_file {nf_id} has total_chunks=0 "
+                    f"(no chunks stored)"
+                )
+                failures += 1
+                continue
+
+            if sizes_only:
+                errs = verify_sizes_only(
+                    state,
+                    s3,
+                    [(chunk_key(c["hash"]), c["compressed_size"]) for c in chunks],
+                )
+            else:
+                errs = verify_cdc(
+                    state,
+                    s3,
+                    chunks,
+                    ni["nar_hash"],
+                    ni["nar_size"],
+                )
+            if errs:
+                for e in errs:
+                    out.append(f"  [FAIL] {e}")
+                failures += 1
+            elif sizes_only:
+                out.append(f"  [PASS] CDC: {len(chunks)} chunk size(s) match")
+            else:
+                out.append(
+                    f"  [PASS] CDC: {total_chunks} chunk(s) verified, "
+                    f"NAR hash and size match"
+                )
+
+        else:
+            # Expect flat file; presence of chunks is a failure
+            if total_chunks > 0:
+                out.append(
+                    f"  [FAIL] CDC disabled but nar_file {nf_id} has "
+                    f"total_chunks={total_chunks} (unexpected chunks)"
+                )
+                failures += 1
+                continue
+
+            if sizes_only:
+                errs = verify_sizes_only(
+                    state, s3, [(nar_file_key(nf_hash, nf_compression), nf_file_size)]
+                )
+            else:
+                errs = verify_flat(
+                    state,
+                    s3,
+                    nf_hash,
+                    nf_compression,
+                    nf_file_size,
+                    ni["file_hash"],
+                )
+            if errs:
+                for e in errs:
+                    out.append(f"  [FAIL] {e}")
+                failures += 1
+            elif sizes_only:
+                out.append("  [PASS] Flat file: size matches")
+            else:
+                desc = (
+                    f"{nf_compression}"
+                    if nf_compression and nf_compression != "none"
+                    else "uncompressed"
+                )
+                out.append(f"  [PASS] Flat file ({desc}): size and hash match")
+
+    out.append("")
+    return out, failures
+
+
+# ---------------------------------------------------------------------------
+# Daemon mode
+# ---------------------------------------------------------------------------
+
+
+def serve_stdin(state, s3, conn, db_type, sizes_only):
+    """
+    Verify narinfo hashes read from stdin, one per line, until EOF.
+
+    The state file, DB connection and S3 client are set up once by main() and
+    reused for every request, so repeated checks skip the connection cost.
+    Each report is flushed as soon as it is complete. Returns the total number
+    of failures.
+    """
+    cur = cursor(conn, db_type)
+    p = placeholder(db_type)
+    failures = 0
+
+    for line in sys.stdin:
+        ni_hash = line.strip()
+        if not ni_hash:
+            continue
+
+        cur.execute(f"SELECT * FROM narinfos WHERE hash = {p}", (ni_hash,))
+        narinfos = cur.fetchall()
+        nar_files_by_narinfo = fetch_nar_files(
+            cur, db_type, [ni["id"] for ni in narinfos]
+        )
+        # Don't sit idle inside an open read transaction between requests.
+        conn.rollback()
+
+        if not narinfos:
+            print(f"[{ni_hash}]\n  [FAIL] No narinfo with this hash\n")
+            failures += 1
+        for ni in narinfos:
+            lines, ni_failures = verify_narinfo(
+                state, s3, ni, nar_files_by_narinfo.get(ni["id"], []), sizes_only
+            )
+            print("\n".join(lines))
+            failures += ni_failures
+        sys.stdout.flush()
+
+    return failures
+
+
 # ---------------------------------------------------------------------------
 # Main verification loop
 # ---------------------------------------------------------------------------
@@ -424,10 +849,26 @@ def main():
     print()
 
     conn, db_type = connect_db(state)
+    # One S3 client for the whole run; building one loads the service model.
+    # Each of the --jobs narinfo workers fans its reads out over CHUNK_WORKERS
+    # (chunk GETs) or SIZE_CHECK_WORKERS (--sizes-only HEADs).
+    s3 = (
+        get_s3_client(
+            state["s3"], args.jobs * max(CHUNK_WORKERS, SIZE_CHECK_WORKERS)
+        )
+        if storage == "s3"
+        else None
+    )
     cur = cursor(conn, db_type)
     p = placeholder(db_type)
 
     try:
+        if args.daemon:
+            print("Reading narinfo hashes from stdin...\n", flush=True)
+            if serve_stdin(state, s3, conn, db_type, args.sizes_only):
+                sys.exit(1)
+            return
+
         # --- fetch narinfos ---
         if args.filter_hash:
             cur.execute(
@@ -445,98 +886,29 @@ def main():
         total = len(narinfos)
         print(f"Verifying {total} narinfo(s)...\n")
 
-        failures = 0
-
-        for ni in narinfos:
-            ni_id = ni["id"]
-            ni_hash = ni["hash"]
-            store_path = ni["store_path"] or "(unknown)"
+        nar_files_by_narinfo = fetch_nar_files(
+            cur, db_type, [ni["id"] for ni in narinfos]
+        )
 
-            print(f"[{ni_hash}]  {store_path}")
+        failures = 0
 
-            # --- find linked nar_file ---
-            cur.execute(
-                f"""
-                SELECT nf.*
-                FROM nar_files nf
-                JOIN narinfo_nar_files nnf ON nnf.nar_file_id = nf.id
-                WHERE nnf.narinfo_id = {p}
-                """,
-                (ni_id,),
+        # Narinfos are independent; verify them on a pool of threads (the
+        # zstd, BLAKE3 and I/O work releases the GIL) and print each report
+        # as it completes, in the original order.
+        with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            reports = pool.map(
+                lambda ni: verify_narinfo(
+                    state,
+                    s3,
+                    ni,
+                    nar_files_by_narinfo.get(ni["id"], []),
+                    args.sizes_only,
+                ),
+                narinfos,
             )
-            nar_files = cur.fetchall()
-
-            if not nar_files:
-                print("  [FAIL] No linked nar_file found in narinfo_nar_files")
-                failures += 1
-                print()
-                continue
-
-            for nf in nar_files:
-                nf_id = nf["id"]
-                total_chunks = nf["total_chunks"]
-                nf_hash = nf["hash"]
-                nf_compression = nf["compression"] or ""
-                nf_file_size = nf["file_size"]
-
-                if cdc_enabled:
-                    # Expect chunks; absence is a failure
-                    if total_chunks == 0:
-                        print(
-                            f"  [FAIL] CDC enabled but nar_file {nf_id} has total_chunks=0 "
-                            f"(no chunks stored)"
-                        )
-                        failures += 1
-                        continue
-
-                    errs = verify_cdc(
-                        cur,
-                        db_type,
-                        state,
-                        nf_id,
-                        ni["nar_hash"],
-                        ni["nar_size"],
-                    )
-                    if errs:
-                        for e in errs:
-                            print(f"  [FAIL] {e}")
-                        failures += 1
-                    else:
-                        print(
-                            f"  [PASS] CDC: {total_chunks} chunk(s) verified, "
-                            f"NAR hash and size match"
-                        )
-
-                else:
-                    # Expect flat file; presence of chunks is a failure
-                    if total_chunks > 0:
-                        print(
-                            f"  [FAIL] CDC disabled but nar_file {nf_id} has "
-                            f"total_chunks={total_chunks} (unexpected chunks)"
-                        )
-                        failures += 1
-                        continue
-
-                    errs = verify_flat(
-                        state,
-                        nf_hash,
-                        nf_compression,
-                        nf_file_size,
-                        ni["file_hash"],
-                    )
-                    if errs:
-                        for e in errs:
-                            print(f"  [FAIL] {e}")
-                        failures += 1
-                    else:
-                        desc = (
-                            f"{nf_compression}"
-                            if nf_compression and nf_compression != "none"
-                            else "uncompressed"
-                        )
-                        print(f"  [PASS] Flat file ({desc}): size and hash match")
-
-            print()
+            for lines, ni_failures in reports:
+                print("\n".join(lines))
+                failures += ni_failures
 
         # --- summary ---
         if failures == 0:
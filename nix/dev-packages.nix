@@ -1,6 +1,6 @@
 # Common development packages shared between the devShell and the docker-dev image.
 # Note: python3 is NOT included here because devShell and docker-dev need different
-# package sets (devShell includes httpx; docker-dev does not).
+# package sets (devShell includes aiohttp; docker-dev does not).
 # Usage: import ./dev-packages.nix pkgs
 pkgs: with pkgs; [
   go
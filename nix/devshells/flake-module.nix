@@ -27,7 +27,7 @@
             # python environment for dev-scripts.
             (pkgs.python3.withPackages (
               ps: with ps; [
-                httpx # httpx is used by dev-scripts/ttfb.py.
+                aiohttp # aiohttp is used by dev-scripts/ttfb.py.
 
                 # used by dev-scripts/verify-data.py
                 psycopg2-binary
@@ -128,6 +128,15 @@ def scenario_bucket_name(scenario_name: str) -> str:
     return f"ncps-{scenario_name}"
 
 
+def scenario_database_name(scenario_name: str) -> str:
+    """Per-scenario PostgreSQL/MariaDB database name (``ncps_<name>``).
+
+    Hyphens become underscores so the name is a bare SQL identifier. Mirrored in
+    ``config.nix`` (``generateValues``); keep them in sync.
+    """
+    return f"ncps_{scenario_name.replace('-', '_')}"
+
+
 def storage_flags(storage: str):
     """ncps CLI storage flags for `local` or `s3`."""
     if storage == "local":
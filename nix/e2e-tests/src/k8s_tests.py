@@ -11,22 +11,27 @@ Provides unified interface for Kind cluster integration testing:
 
 import argparse
 import base64
+import hashlib
 import json
 import os
-import re
-import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 import yaml
 
-from harness_config import scenario_bucket_name
+from harness_config import scenario_bucket_name, scenario_database_name
+from pod_readiness import PodReadinessTracker
+from polling import poll
+from thread_output import captured_stdout
 
 try:
     import boto3
@@ -34,6 +39,7 @@ try:
     import pymysql
     from kubernetes import client
     from kubernetes import config as k8s_config
+    from kubernetes import watch
 except ImportError:
     # Failures here are handled gracefully if specific tests are run
     boto3 = None
@@ -41,6 +47,11 @@ except ImportError:
     pymysql = None
     client = None
     k8s_config = None
+    watch = None
+
+# The generated files hold only JSON-shaped data, so the safe dumper is
+# enough; prefer the libyaml-backed one when PyYAML was built with it.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 # Constants
 REPO_ROOT = (
@@ -48,7 +59,22 @@ REPO_ROOT = (
 )
 TEST_VALUES_DIR = os.path.join(REPO_ROOT, "charts/ncps/test-values")
 CHART_DIR = os.path.join(REPO_ROOT, "charts/ncps")
+IMAGE_STATE_FILE = os.path.join(TEST_VALUES_DIR, ".last_image_state.json")
+NIX_EVAL_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "ncps-k8s-tests",
+)
 CLUSTER_NAME = "ncps-kind"
+# (os.uname() sysname, machine) -> Nix system the image is built for. The
+# image always targets Linux, so macOS hosts build for the matching Linux arch.
+NIX_PLATFORMS = {
+    ("darwin", "arm64"): "aarch64-linux",
+    ("darwin", "x86_64"): "x86_64-linux",
+    ("linux", "arm64"): "aarch64-linux",
+    ("linux", "aarch64"): "aarch64-linux",
+    ("linux", "x86_64"): "x86_64-linux",
+    ("linux", "amd64"): "x86_64-linux",
+}
 
 
 class K8sTestsCLI:
@@ -58,9 +84,39 @@ class K8sTestsCLI:
         self.config_file = os.environ.get(
             "CONFIG_FILE", os.path.join(REPO_ROOT, "nix/e2e-tests/config.nix")
         )
+        self._k8s_core_v1 = None
+        # Setup steps run on worker threads; build the client only once.
+        self._k8s_lock = threading.Lock()
+        self._creds_cache: Optional[Dict[str, Any]] = None
+        self._path_index: Optional[set] = None
+        self._log_lock = threading.Lock()
+        self._nix_cache: Dict[Optional[str], Dict[str, Any]] = {}
+
+    def _core_v1(self):
+        """Return a CoreV1Api for the Kind cluster, built once and reused.
+
+        One client keeps one authenticated connection pool to the API server
+        instead of a kubectl fork (kubeconfig parse + TLS handshake) per read.
+        """
+        with self._k8s_lock:
+            if self._k8s_core_v1 is None:
+                k8s_config.load_kube_config(context=f"kind-{CLUSTER_NAME}")
+                self._k8s_core_v1 = client.CoreV1Api()
+        return self._k8s_core_v1
+
+    def _read_secret(self, ns: str, name: str, key: str) -> str:
+        """Return one decoded value of a secret ("" if the key is absent).
+
+        Raises the client's ApiException if the secret cannot be read.
+        """
+        secret = self._core_v1().read_namespaced_secret(name, ns)
+        value = (secret.data or {}).get(key)
+        return base64.b64decode(value).decode() if value else ""
 
     def log(self, msg: str):
-        print(msg)
+        # Setup steps log from worker threads (see _run_parallel).
+        with self._log_lock:
+            print(msg)
 
     def error(self, msg: str):
         print(f"❌ Error: {msg}", file=sys.stderr)
@@ -90,10 +146,16 @@ class K8sTestsCLI:
             )
         except subprocess.CalledProcessError as e:
             err_msg = f"Command failed with exit code {e.returncode}: {' '.join(cmd)}"
-            if e.stdout:
-                err_msg += f"\nSTDOUT: {e.stdout.strip()}"
-            if e.stderr:
-                err_msg += f"\nSTDERR: {e.stderr.strip()}"
+            # With text=False the output is bytes; decode it so multi-line
+            # errors (e.g. a nix eval trace) print as lines, not a b'...' repr.
+            stdout, stderr = (
+                out.decode(errors="replace") if isinstance(out, bytes) else out
+                for out in (e.stdout, e.stderr)
+            )
+            if stdout:
+                err_msg += f"\nSTDOUT: {stdout.strip()}"
+            if stderr:
+                err_msg += f"\nSTDERR: {stderr.strip()}"
             self.error(err_msg)
         except FileNotFoundError:
             self.error(f"Command not found: {cmd[0]}")
@@ -132,23 +194,181 @@ class K8sTestsCLI:
             err_msg += f"\nSTDERR: {result.stderr.strip()}"
         self.error(err_msg)
 
+    def _run_parallel(self, tasks: List[Callable[[], Any]], max_workers: int):
+        """Run independent setup steps concurrently and wait for all of them.
+
+        Each task is a thunk (typically wrapping run_cmd/run_cmd_with_retry).
+        The first failure cancels the tasks that have not started yet and is
+        re-raised once the running ones have finished; that includes the
+        SystemExit raised by self.error() in a worker thread.
+        max_workers <= 1 runs the tasks serially, in order.
+        """
+        if max_workers <= 1:
+            for task in tasks:
+                task()
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(task) for task in tasks]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    future.result()
+
+    def _psql(self, *args: str, check: bool = True, input: Optional[str] = None):
+        """Run psql as postgres in the CNPG primary (pg17-ncps-1).
+
+        With `input`, the exec attaches stdin (`kubectl exec -i`) for a script.
+        """
+        stdin = ["-i"] if input is not None else []
+        return self.run_cmd(
+            ["kubectl", "exec", *stdin, "-n", "data", "pg17-ncps-1", "--"]
+            + ["psql", "-U", "postgres", *args],
+            check=check,
+            input=input,
+        )
+
+    def _mariadb(
+        self,
+        root_password: str,
+        *args: str,
+        check: bool = True,
+        input: Optional[str] = None,
+    ):
+        """Run the mariadb client as root in the primary (mariadb-ncps-0).
+
+        With `input`, the exec attaches stdin (`kubectl exec -i`) for a script.
+        """
+        stdin = ["-i"] if input is not None else []
+        return self.run_cmd(
+            ["kubectl", "exec", *stdin, "-n", "data", "mariadb-ncps-0", "--"]
+            + ["mariadb", "-u", "root", f"-p{root_password}", *args],
+            check=check,
+            input=input,
+        )
+
+    def _nix_config(self, args_json: Optional[str] = None) -> Dict[str, Any]:
+        """Evaluate everything this CLI needs from the e2e config in one `nix eval`.
+
+        Returns {"permutations", "narinfo_hashes"} plus, when `args_json` (the
+        generateValues arguments) is given, "values". Each Nix invocation
+        re-parses and re-evaluates config.nix, so the bundle is memoized for
+        the rest of the run; any cached bundle serves a plain lookup.
+
+        The plain bundle is also cached on disk under NIX_EVAL_CACHE_DIR, keyed
+        by the SHA-256 of config.nix (self-contained, no imports) and the
+        expression, so separate invocations (install, cleanup, ...) skip Nix
+        until the config changes. Bundles with values embed cluster passwords
+        and are never written to disk.
+        """
+        if args_json in self._nix_cache:
+            return self._nix_cache[args_json]
+        if args_json is None and self._nix_cache:
+            return next(iter(self._nix_cache.values()))
+
+        fields = [
+            "permutations = c.permutations;",
+            "narinfo_hashes = c.testData.narinfo_hashes;",
+        ]
+        args_file = None
+        if args_json is not None:
+            # Handed over in a private temp file rather than spliced into the
+            # expression: the arguments carry cluster passwords (kept out of
+            # argv and `ps`) and need no Nix string escaping this way.
+            args_file = tempfile.NamedTemporaryFile(
+                "w", prefix="ncps-generate-args-", suffix=".json"
+            )
+            args_file.write(args_json)
+            args_file.flush()
+            fields.append(
+                "values = c.generateValues (builtins.fromJSON "
+                f"(builtins.readFile {json.dumps(args_file.name)}));"
+            )
+        expr = f"c: {{ {' '.join(fields)} }}"
+
+        cache_path = None
+        if args_json is None:
+            with open(self.config_file, "rb") as f:
+                digest = hashlib.sha256(f.read())
+            digest.update(expr.encode())
+            cache_path = os.path.join(NIX_EVAL_CACHE_DIR, f"{digest.hexdigest()}.json")
+            try:
+                with open(cache_path, "rb") as f:
+                    bundle = json.loads(f.read())
+                self._nix_cache[args_json] = bundle
+                return bundle
+            except (OSError, ValueError):
+                pass
+
+        # Output stays bytes for json.loads, skipping a UTF-8 decode into str.
+        try:
+            raw = self.run_cmd(
+                ["nix", "eval", "--json", "--file", self.config_file, "--apply", expr],
+                capture_output=True,
+                text=False,
+            ).stdout
+        finally:
+            if args_file is not None:
+                args_file.close()
+        bundle = json.loads(raw)
+        self._nix_cache[args_json] = bundle
+
+        if cache_path is not None:
+            # Best effort: a read-only or full cache dir only costs the next
+            # run an evaluation.
+            try:
+                os.makedirs(NIX_EVAL_CACHE_DIR, exist_ok=True)
+                with open(cache_path + ".tmp", "wb") as f:
+                    f.write(raw)
+                os.replace(cache_path + ".tmp", cache_path)
+            except OSError:
+                pass
+        return bundle
+
+    def _permutations_by_name(self) -> Dict[str, Dict[str, Any]]:
+        """Index the config's permutations by scenario name."""
+        return {p["name"]: p for p in self._nix_config()["permutations"]}
+
+    def _which(self, tool: str) -> bool:
+        """Report whether `tool` is a file in some $PATH directory.
+
+        Each $PATH directory is listed once and the names are memoized, so
+        several pre-flight lookups cost one directory scan each instead of a
+        stat() per directory per tool.
+        """
+        if self._path_index is None:
+            names = set()
+            for path_dir in os.environ.get("PATH", "").split(os.pathsep):
+                try:
+                    with os.scandir(path_dir or ".") as entries:
+                        names.update(entry.name for entry in entries)
+                except OSError:
+                    continue
+            self._path_index = names
+        return tool in self._path_index
+
     # --- Cluster Management ---
 
-    def cmd_cluster_create(self):
+    def cmd_cluster_create(self, helm_concurrency: int = 4, install_concurrency: int = 4):
         self.log("🚀 Initializing NCPS Kubernetes Development Environment...")
 
         # Pre-flight checks
-        for cmd in ["docker", "kind", "kubectl", "helm"]:
-            if not shutil.which(cmd):
-                self.error(f"'{cmd}' is not installed.")
+        missing = [
+            cmd for cmd in ("docker", "kind", "kubectl", "helm") if not self._which(cmd)
+        ]
+        if missing:
+            self.error(f"Missing required tools: {', '.join(missing)}")
 
         # Check docker running
         self.run_cmd(["docker", "info"], capture_output=True)
 
         # Create Kind Cluster
-        clusters = self.run_cmd(
-            ["kind", "get", "clusters"], capture_output=True
-        ).stdout.splitlines()
+        clusters = set(
+            self.run_cmd(
+                ["kind", "get", "clusters", "--quiet"], capture_output=True
+            ).stdout.splitlines()
+        )
         if CLUSTER_NAME not in clusters:
             self.log("📦 Creating Kind cluster...")
             kind_config = f"""
@@ -183,13 +403,21 @@ nodes:
             "mariadb-operator": "https://mariadb-operator.github.io/mariadb-operator/",
             "ot-helm": "https://ot-container-kit.github.io/helm-charts/",
         }
-        for name, url in repos.items():
-            self.run_cmd(["helm", "repo", "add", name, url, "--force-update"])
+        # Independent network fetches; helm serializes its repositories.yaml
+        # writes with a file lock.
+        self._run_parallel(
+            [
+                lambda name=name, url=url: self.run_cmd(
+                    ["helm", "repo", "add", name, url, "--force-update"]
+                )
+                for name, url in repos.items()
+            ],
+            helm_concurrency,
+        )
         self.run_cmd(["helm", "repo", "update"])
 
         # Garage (S3-compatible storage). Deployed via raw manifests — Garage has
         # no first-party Helm chart and the test setup only needs a single node.
-        self.log("   - Installing Garage...")
         garage_manifest = """
 apiVersion: v1
 kind: Namespace
@@ -304,94 +532,97 @@ spec:
       port: 3903
       targetPort: 3903
 """
-        self.run_cmd(["kubectl", "apply", "-f", "-"], input=garage_manifest)
-        # `kubectl rollout status` waits for the controller to create the pod
-        # *and* for it to become ready. `kubectl wait` would race the controller
-        # and exit with "no matching resources found" before the pod is scheduled.
-        self.run_cmd(
-            [
-                "kubectl",
-                "rollout",
-                "status",
-                "--namespace",
-                "garage",
-                "statefulset/garage",
-                "--timeout=180s",
-            ]
-        )
-
-        # Configure Garage (layout, bucket, access key).
-        # The dxflrs/garage image is distroless (no /bin/sh, no awk), so we
-        # orchestrate each step here and exec the `/garage` binary directly.
-        self.log("   ⚙️  Configuring Garage (layout, bucket, access key)...")
 
-        def garage_exec(*args: str, check: bool = True) -> subprocess.CompletedProcess:
-            return self.run_cmd(
+        def setup_garage():
+            self.log("   - Installing Garage...")
+            self.run_cmd(["kubectl", "apply", "-f", "-"], input=garage_manifest)
+            # `kubectl rollout status` waits for the controller to create the pod
+            # *and* for it to become ready. `kubectl wait` would race the controller
+            # and exit with "no matching resources found" before the pod is scheduled.
+            self.run_cmd(
                 [
                     "kubectl",
-                    "exec",
+                    "rollout",
+                    "status",
                     "--namespace",
                     "garage",
-                    "garage-0",
-                    "--",
-                    "/garage",
-                    *args,
-                ],
-                check=check,
-                capture_output=True,
+                    "statefulset/garage",
+                    "--timeout=180s",
+                ]
             )
 
-        # 1. Look up the node id and assign a single-node layout if not already done.
-        node_id_out = garage_exec("node", "id", "-q").stdout.strip()
-        # Format: "<node_id>@<ip>:<port>"; take just the node_id.
-        node_id = node_id_out.split("@", 1)[0]
-
-        layout_show = garage_exec("layout", "show", check=False).stdout
-        if node_id not in layout_show:
-            garage_exec("layout", "assign", "-z", "dc1", "-c", "1G", node_id)
-            # First apply on a fresh cluster is version 1; otherwise increment.
-            # Parse "Current cluster layout version: N" from `layout show` output.
-            layout_show2 = garage_exec("layout", "show").stdout
-            version = 1
-            for line in layout_show2.splitlines():
-                if "Current cluster layout version:" in line:
-                    version = int(line.rsplit(":", 1)[1].strip()) + 1
-                    break
-            garage_exec("layout", "apply", "--version", str(version))
-
-        # 2. Import the access key (idempotent).
-        if garage_exec("key", "info", "GK1234567890abcdef12345678", check=False).returncode != 0:
-            garage_exec("key", "import", "--yes", "GK1234567890abcdef12345678", "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef")
-
-        # 3. Create + grant a bucket PER SCENARIO so no scenario observes objects
-        # written by another (mirrors the per-scenario ncps_<name> databases).
-        # A shared bucket let residual whole-file NARs from an earlier non-CDC
-        # scenario make a later CDC scenario skip chunking and report 0 chunks.
-        permutations = json.loads(
-            self.run_cmd(
-                ["nix", "eval", "--json", "--file", self.config_file, "permutations"],
-                capture_output=True,
-            ).stdout
-        )
-        s3_buckets = sorted(
-            {
-                scenario_bucket_name(perm["name"])
-                for perm in permutations
-                if (perm.get("storage") or {}).get("type") == "s3"
-            }
-        )
-        for bucket in s3_buckets:
-            if garage_exec("bucket", "info", bucket, check=False).returncode != 0:
-                garage_exec("bucket", "create", bucket)
-            garage_exec(
-                "bucket", "allow", "--read", "--write", "--owner",
-                bucket, "--key", "GK1234567890abcdef12345678",
+            # Configure Garage (layout, bucket, access key).
+            # The dxflrs/garage image is distroless (no /bin/sh, no awk), so we
+            # orchestrate each step here and exec the `/garage` binary directly.
+            self.log("   ⚙️  Configuring Garage (layout, bucket, access key)...")
+
+            def garage_exec(*args: str, check: bool = True) -> subprocess.CompletedProcess:
+                return self.run_cmd(
+                    [
+                        "kubectl",
+                        "exec",
+                        "--namespace",
+                        "garage",
+                        "garage-0",
+                        "--",
+                        "/garage",
+                        *args,
+                    ],
+                    check=check,
+                    capture_output=True,
+                )
+
+            # 1. Look up the node id and assign a single-node layout if not already done.
+            node_id_out = garage_exec("node", "id", "-q").stdout.strip()
+            # Format: "<node_id>@<ip>:<port>"; take just the node_id.
+            node_id = node_id_out.split("@", 1)[0]
+
+            layout_show = garage_exec("layout", "show", check=False).stdout
+            if node_id not in layout_show:
+                garage_exec("layout", "assign", "-z", "dc1", "-c", "1G", node_id)
+                # First apply on a fresh cluster is version 1; otherwise increment.
+                # Parse "Current cluster layout version: N" from `layout show` output.
+                layout_show2 = garage_exec("layout", "show").stdout
+                version = 1
+                for line in layout_show2.splitlines():
+                    if "Current cluster layout version:" in line:
+                        version = int(line.rsplit(":", 1)[1].strip()) + 1
+                        break
+                garage_exec("layout", "apply", "--version", str(version))
+
+            # 2. Import the access key (idempotent).
+            if garage_exec("key", "info", "GK1234567890abcdef12345678", check=False).returncode != 0:
+                garage_exec("key", "import", "--yes", "GK1234567890abcdef12345678", "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef")
+
+            # 3. Create + grant a bucket PER SCENARIO so no scenario observes objects
+            # written by another (mirrors the per-scenario ncps_<name> databases).
+            # A shared bucket let residual whole-file NARs from an earlier non-CDC
+            # scenario make a later CDC scenario skip chunking and report 0 chunks.
+            permutations = self._nix_config()["permutations"]
+            s3_buckets = sorted(
+                {
+                    scenario_bucket_name(perm["name"])
+                    for perm in permutations
+                    if (perm.get("storage") or {}).get("type") == "s3"
+                }
+            )
+
+            def setup_bucket(bucket: str):
+                if garage_exec("bucket", "info", bucket, check=False).returncode != 0:
+                    garage_exec("bucket", "create", bucket)
+                garage_exec(
+                    "bucket", "allow", "--read", "--write", "--owner",
+                    bucket, "--key", "GK1234567890abcdef12345678",
+                )
+
+            # Buckets are independent; overlap their exec round trips.
+            self._run_parallel(
+                [lambda bucket=bucket: setup_bucket(bucket) for bucket in s3_buckets],
+                install_concurrency,
             )
-        self.log(f"   ✅ Garage configured ({len(s3_buckets)} per-scenario buckets).")
+            self.log(f"   ✅ Garage configured ({len(s3_buckets)} per-scenario buckets).")
 
         # Registry
-        self.log("   - Installing Container Registry...")
-        self.run_cmd(["kubectl", "create", "namespace", "registry"], check=False)
         registry_manifest = """
 apiVersion: v1
 kind: PersistentVolumeClaim
@@ -435,84 +666,116 @@ spec:
   selector: { app: registry }
   ports: [{ port: 5000, targetPort: 5000, nodePort: 30000, protocol: TCP }]
 """
-        self.run_cmd(["kubectl", "apply", "-f", "-"], input=registry_manifest)
-        self.run_cmd(
-            [
-                "kubectl",
-                "wait",
-                "--for=condition=Ready",
-                "pod",
-                "-l",
-                "app=registry",
-                "-n",
-                "registry",
-                "--timeout=180s",
-            ]
-        )
+
+        def setup_registry():
+            self.log("   - Installing Container Registry...")
+            self.run_cmd(["kubectl", "create", "namespace", "registry"], check=False)
+            self.run_cmd(["kubectl", "apply", "-f", "-"], input=registry_manifest)
+            # Nothing precedes this wait any more, so use `rollout status` (as
+            # for Garage) rather than a `kubectl wait` that can run before the
+            # Deployment has created its pod.
+            self.run_cmd(
+                [
+                    "kubectl",
+                    "rollout",
+                    "status",
+                    "--namespace",
+                    "registry",
+                    "deployment/registry",
+                    "--timeout=180s",
+                ]
+            )
 
         # Operators. Retry each install: these charts are fetched from GitHub
         # release assets, whose CDN intermittently returns 504 (see
-        # run_cmd_with_retry).
-        self.log("   - Installing Operators...")
-        self.run_cmd_with_retry(
-            [
-                "helm",
-                "upgrade",
-                "--install",
-                "cnpg",
-                "cnpg/cloudnative-pg",
-                "--namespace",
-                "cnpg-system",
-                "--create-namespace",
-                "--wait",
-            ]
-        )
-        self.run_cmd_with_retry(
-            [
-                "helm",
-                "upgrade",
-                "--install",
-                "mariadb-operator-crds",
-                "mariadb-operator/mariadb-operator-crds",
-                "--namespace",
-                "mariadb-system",
-                "--create-namespace",
-                "--wait",
-            ]
-        )
-        self.run_cmd_with_retry(
-            [
-                "helm",
-                "upgrade",
-                "--install",
-                "mariadb-operator",
-                "mariadb-operator/mariadb-operator",
-                "--namespace",
-                "mariadb-system",
-                "--create-namespace",
-                "--set",
-                "webhook.cert.certManager.enabled=false",
-                "--wait",
-            ]
-        )
-        self.run_cmd_with_retry(
+        # run_cmd_with_retry). Only the MariaDB CRDs must precede the MariaDB
+        # operator.
+
+        def install_cnpg():
+            self.log("   - Installing CloudNativePG operator...")
+            self.run_cmd_with_retry(
+                [
+                    "helm",
+                    "upgrade",
+                    "--install",
+                    "cnpg",
+                    "cnpg/cloudnative-pg",
+                    "--namespace",
+                    "cnpg-system",
+                    "--create-namespace",
+                    "--wait",
+                ]
+            )
+
+        def install_mariadb_operator():
+            self.log("   - Installing MariaDB operator...")
+            self.run_cmd_with_retry(
+                [
+                    "helm",
+                    "upgrade",
+                    "--install",
+                    "mariadb-operator-crds",
+                    "mariadb-operator/mariadb-operator-crds",
+                    "--namespace",
+                    "mariadb-system",
+                    "--create-namespace",
+                    "--wait",
+                ]
+            )
+            self.run_cmd_with_retry(
+                [
+                    "helm",
+                    "upgrade",
+                    "--install",
+                    "mariadb-operator",
+                    "mariadb-operator/mariadb-operator",
+                    "--namespace",
+                    "mariadb-system",
+                    "--create-namespace",
+                    "--set",
+                    "webhook.cert.certManager.enabled=false",
+                    "--wait",
+                ]
+            )
+
+        def install_redis_operator():
+            self.log("   - Installing Redis operator...")
+            self.run_cmd_with_retry(
+                [
+                    "helm",
+                    "upgrade",
+                    "--install",
+                    "redis-operator",
+                    "ot-helm/redis-operator",
+                    "--namespace",
+                    "redis-system",
+                    "--create-namespace",
+                    "--wait",
+                ]
+            )
+
+        # Garage, the registry and the operators share no state, so their
+        # bring-up chains overlap and this phase takes about as long as the
+        # slowest chain rather than the sum of all of them.
+        self._run_parallel(
             [
-                "helm",
-                "upgrade",
-                "--install",
-                "redis-operator",
-                "ot-helm/redis-operator",
-                "--namespace",
-                "redis-system",
-                "--create-namespace",
-                "--wait",
-            ]
+                setup_garage,
+                setup_registry,
+                install_cnpg,
+                install_mariadb_operator,
+                install_redis_operator,
+            ],
+            install_concurrency,
         )
 
         # Deploy Databases
         self.log("🔥 Deploying database instances...")
-        self.run_cmd(["kubectl", "create", "namespace", "data"], check=False)
-
+        namespace_manifest = """
+apiVersion: v1
+kind: Namespace
+metadata:
+  name: data
+"""
         pg_manifest = """
 apiVersion: postgresql.cnpg.io/v1
 kind: Cluster
@@ -570,289 +833,214 @@ spec:
           requests:
             storage: 1Gi
 """
-        self.run_cmd(["kubectl", "apply", "-f", "-"], input=pg_manifest)
-        self.run_cmd(["kubectl", "apply", "-f", "-"], input=maria_manifest)
-        self.run_cmd(["kubectl", "apply", "-f", "-"], input=redis_manifest)
+        # One multi-document stream: the namespace is applied first, then the
+        # instances, in a single kubectl session.
+        self.run_cmd(
+            ["kubectl", "apply", "-f", "-"],
+            input="---".join(
+                [namespace_manifest, pg_manifest, maria_manifest, redis_manifest]
+            ),
+        )
 
         self.log("⏳ Waiting for databases to initialize...")
-        self._wait_for_pods("cnpg.io/cluster=pg17-ncps", "data")
-        self._wait_for_pods("app.kubernetes.io/instance=mariadb-ncps", "data")
-        self._wait_for_pods("app=redis-ncps", "data")
-
-        # Wait for PostgreSQL primary to be fully ready for connections
-        # CNPG creates multiple pods (init job, primary instance, etc)
-        # We need to ensure the primary instance pod (pg17-ncps-1) exists and is ready
-        self.log("   Waiting for PostgreSQL primary instance to be fully ready...")
-        for attempt in range(30):
-            try:
-                # Check if pg17-ncps-1 pod exists and is Ready
-                res = self.run_cmd(
-                    [
-                        "kubectl",
-                        "get",
-                        "pod",
-                        "-n",
-                        "data",
-                        "pg17-ncps-1",
-                        "-o",
-                        'jsonpath={.status.conditions[?(@.type=="Ready")].status}',
-                    ],
-                    capture_output=True,
-                    check=False,
-                )
-                if res.stdout.strip() == "True":
-                    # Pod exists and is Ready, now verify PostgreSQL is responding
-                    check_result = self.run_cmd(
-                        [
-                            "kubectl",
-                            "exec",
-                            "-n",
-                            "data",
-                            "pg17-ncps-1",
-                            "--",
-                            "pg_isready",
-                            "-U",
-                            "postgres",
-                        ],
-                        capture_output=True,
-                        check=False,
-                    )
-                    if check_result.returncode == 0:
-                        self.log("   ✅ PostgreSQL is ready for connections")
-                        break
-            except Exception:
-                pass
-            time.sleep(2)
-        else:
-            self.error("Timed out waiting for PostgreSQL primary instance to be ready")
+        self._run_parallel(
+            [
+                lambda: self._wait_for_pods("cnpg.io/cluster=pg17-ncps", "data"),
+                lambda: self._wait_for_pods(
+                    "app.kubernetes.io/instance=mariadb-ncps", "data"
+                ),
+                lambda: self._wait_for_pods("app=redis-ncps", "data"),
+            ],
+            3,
+        )
 
         # Create per-test databases for isolation
         self.log("🔐 Creating per-test databases for isolation...")
 
         # Load permutations from Nix config
-        permutations = json.loads(
-            self.run_cmd(
-                ["nix", "eval", "--json", "--file", self.config_file, "permutations"],
-                capture_output=True,
-            ).stdout
-        )
+        permutations = self._nix_config()["permutations"]
 
-        # PostgreSQL databases
-        pgsql_databases = []
+        # Per-engine database names, in one pass
+        databases_by_type = {"postgresql": set(), "mysql": set()}
         for perm in permutations:
-            if perm.get("database", {}).get("type") == "postgresql":
-                db_name = f"ncps_{perm['name'].replace('-', '_')}"
-                pgsql_databases.append(db_name)
-
-        for db_name in sorted(set(pgsql_databases)):
-            self.log(f"   - Creating PostgreSQL database: {db_name}")
-            self.run_cmd(
-                [
-                    "kubectl",
-                    "exec",
-                    "-n",
-                    "data",
-                    "pg17-ncps-1",
-                    "--",
-                    "psql",
-                    "-U",
-                    "postgres",
-                    "-c",
-                    f"CREATE DATABASE {db_name};",
-                ],
-                check=False,
-            )  # Ignore error if database already exists
-            self.run_cmd(
-                [
-                    "kubectl",
-                    "exec",
-                    "-n",
-                    "data",
-                    "pg17-ncps-1",
-                    "--",
-                    "psql",
-                    "-U",
-                    "postgres",
-                    "-c",
-                    f"GRANT ALL PRIVILEGES ON DATABASE {db_name} TO ncps;",
-                ]
+            db_type = (perm.get("database") or {}).get("type")
+            if db_type in databases_by_type:
+                databases_by_type[db_type].add(scenario_database_name(perm["name"]))
+        pgsql_databases = sorted(databases_by_type["postgresql"])
+        mariadb_databases = sorted(databases_by_type["mysql"])
+
+        # Wait for both primaries to accept connections concurrently; each
+        # engine's database creation only waits on its own readiness.
+        # CNPG creates multiple pods (init job, primary instance, etc), so poll
+        # the primary instance pod (pg17-ncps-1); the MariaDB operator creates
+        # the primary instance pod mariadb-ncps-0.
+        self.log("   Waiting for database primary instances to be fully ready...")
+        readiness = ThreadPoolExecutor(max_workers=2)
+        # Set on the way out (including self.error()'s SystemExit), so a wait
+        # still polling stops instead of holding interpreter shutdown, which
+        # joins executor threads, for the rest of its budget.
+        stop_waiting = threading.Event()
+        try:
+            pg_ready = readiness.submit(
+                self._wait_for_db_ready,
+                "pg17-ncps-1",
+                "data",
+                ["pg_isready", "-U", "postgres"],
+                "PostgreSQL",
+                stop_waiting,
             )
-            # Set the public schema owner to ncps so it can create tables
-            self.run_cmd(
-                [
-                    "kubectl",
-                    "exec",
-                    "-n",
+            mariadb_ready = None
+            if mariadb_databases:
+                mariadb_ready = readiness.submit(
+                    self._wait_for_db_ready,
+                    "mariadb-ncps-0",
                     "data",
-                    "pg17-ncps-1",
-                    "--",
-                    "psql",
-                    "-U",
-                    "postgres",
-                    "-d",
-                    db_name,
-                    "-c",
+                    ["mariadb-admin", "ping", "-h", "localhost"],
+                    "MariaDB",
+                    stop_waiting,
+                )
+
+            if not pg_ready.result():
+                self.error(
+                    "Timed out waiting for PostgreSQL primary instance to be ready"
+                )
+
+            # One psql session for every database: each kubectl exec pays an
+            # API-server round trip and container attach. CREATE DATABASE has
+            # no IF NOT EXISTS, so \gexec only issues it for missing databases,
+            # which keeps ON_ERROR_STOP strict for the GRANT/ALTER statements.
+            pg_script = []
+            for db_name in pgsql_databases:
+                self.log(f"   - Creating PostgreSQL database: {db_name}")
+                pg_script += [
+                    f"SELECT 'CREATE DATABASE {db_name}' WHERE NOT EXISTS "
+                    f"(SELECT FROM pg_database WHERE datname = '{db_name}')\\gexec",
+                    f"GRANT ALL PRIVILEGES ON DATABASE {db_name} TO ncps;",
+                    # Set the public schema owner to ncps so it can create tables
+                    f"\\c {db_name}",
                     "ALTER SCHEMA public OWNER TO ncps;",
+                    "\\c postgres",
                 ]
-            )
+            if pg_script:
+                self._psql(
+                    "-v", "ON_ERROR_STOP=1", "-f", "-",
+                    input="\n".join(pg_script) + "\n",
+                )
 
-        # MariaDB databases
-        mariadb_databases = []
-        for perm in permutations:
-            if perm.get("database", {}).get("type") == "mysql":
-                db_name = f"ncps_{perm['name'].replace('-', '_')}"
-                mariadb_databases.append(db_name)
-
-        # Wait for MariaDB primary to be fully ready for connections
-        # MariaDB operator creates the primary instance pod (mariadb-ncps-0)
-        if mariadb_databases:
-            self.log("   Waiting for MariaDB primary instance to be fully ready...")
-            for attempt in range(30):
-                try:
-                    # Check if mariadb-ncps-0 pod exists and is Ready
-                    res = self.run_cmd(
-                        [
-                            "kubectl",
-                            "get",
-                            "pod",
-                            "-n",
-                            "data",
-                            "mariadb-ncps-0",
-                            "-o",
-                            'jsonpath={.status.conditions[?(@.type=="Ready")].status}',
-                        ],
-                        capture_output=True,
-                        check=False,
-                    )
-                    if res.stdout.strip() == "True":
-                        # Pod exists and is Ready, now verify MariaDB is responding
-                        check_result = self.run_cmd(
-                            [
-                                "kubectl",
-                                "exec",
-                                "-n",
-                                "data",
-                                "mariadb-ncps-0",
-                                "--",
-                                "mariadb-admin",
-                                "ping",
-                                "-h",
-                                "localhost",
-                            ],
-                            capture_output=True,
-                            check=False,
-                        )
-                        if check_result.returncode == 0:
-                            self.log("   ✅ MariaDB is ready for connections")
-                            break
-                except Exception:
-                    pass
-                time.sleep(2)
-            else:
+            if mariadb_ready is not None and not mariadb_ready.result():
                 self.error("Timed out waiting for MariaDB primary instance to be ready")
+        finally:
+            stop_waiting.set()
+            readiness.shutdown(wait=False)
 
         # Get MariaDB root password
-        creds = self.get_cluster_creds()
-        mariadb_root_password_b64 = self.run_cmd(
-            [
-                "kubectl",
-                "get",
-                "secret",
-                "-n",
-                "data",
-                "mariadb-root-password",
-                "-o",
-                "jsonpath={.data.password}",
-            ],
-            capture_output=True,
-        ).stdout
-        mariadb_root_password = base64.b64decode(mariadb_root_password_b64).decode()
+        try:
+            mariadb_root_password = self._read_secret(
+                "data", "mariadb-root-password", "password"
+            )
+        except Exception as e:
+            self.error(f"Could not read MariaDB root password: {e}")
 
-        for db_name in sorted(set(mariadb_databases)):
+        # Likewise, one mariadb session creates and grants every database.
+        mariadb_script = []
+        for db_name in mariadb_databases:
             self.log(f"   - Creating MariaDB database: {db_name}")
-            self.run_cmd(
-                [
-                    "kubectl",
-                    "exec",
-                    "-n",
-                    "data",
-                    "mariadb-ncps-0",
-                    "--",
-                    "mariadb",
-                    "-u",
-                    "root",
-                    f"-p{mariadb_root_password}",
-                    "-e",
-                    f"CREATE DATABASE IF NOT EXISTS {db_name};",
-                ]
-            )
-            self.run_cmd(
-                [
-                    "kubectl",
-                    "exec",
-                    "-n",
-                    "data",
-                    "mariadb-ncps-0",
-                    "--",
-                    "mariadb",
-                    "-u",
-                    "root",
-                    f"-p{mariadb_root_password}",
-                    "-e",
-                    f"GRANT ALL PRIVILEGES ON {db_name}.* TO 'ncps'@'%';",
-                ]
+            mariadb_script += [
+                f"CREATE DATABASE IF NOT EXISTS {db_name};",
+                f"GRANT ALL PRIVILEGES ON {db_name}.* TO 'ncps'@'%';",
+            ]
+        if mariadb_script:
+            self._mariadb(
+                mariadb_root_password, input="\n".join(mariadb_script) + "\n"
             )
 
         self.log("✅ Cluster created successfully!")
+        self._creds_cache = None
         self.cmd_cluster_info()
 
-    def _wait_for_pods(self, label: str, ns: str):
-        # Wait for resources to appear
-        for _ in range(30):
-            res = self.run_cmd(
-                ["kubectl", "get", "pod", "-l", label, "-n", ns, "-o", "name"],
-                capture_output=True,
-                check=False,
-            )
-            if res.stdout.strip():
-                break
-            time.sleep(2)
-        else:
-            self.error(
-                f"Timed out waiting for pods with label '{label}' to appear in namespace '{ns}'"
-            )
+    def _wait_for_pods(self, label: str, ns: str, timeout: int = 180):
+        """Block until pods matching `label` exist in `ns` and all are Ready.
 
-        # Wait for condition with retries for transient failures (e.g., pod deleted while waiting)
-        for _ in range(5):
-            try:
-                self.run_cmd(
-                    [
-                        "kubectl",
-                        "wait",
-                        "--for=condition=Ready",
-                        "pod",
-                        "-l",
-                        label,
-                        "-n",
-                        ns,
-                        "--timeout=180s",
-                    ]
-                )
+        A server-side watch on the cached client replays the current pods as
+        ADDED events and then delivers each change as it happens, so there is
+        neither an "appear" polling loop nor a kubectl fork per attempt.
+        """
+        readiness = PodReadinessTracker()
+        pod_watch = watch.Watch()
+        for event in pod_watch.stream(
+            self._core_v1().list_namespaced_pod,
+            namespace=ns,
+            label_selector=label,
+            timeout_seconds=timeout,
+        ):
+            if event["type"] in ("ADDED", "MODIFIED"):
+                readiness.observe(event["object"])
+            elif event["type"] == "DELETED":
+                readiness.forget(event["object"])
+            if readiness.all_seen_ready():
+                pod_watch.stop()
                 return
-            except subprocess.CalledProcessError:
-                self.log(f"   ⚠️  'kubectl wait' failed, retrying...")
-                time.sleep(5)
 
         self.error(
             f"Timed out waiting for pods with label '{label}' to be ready in namespace '{ns}'"
         )
 
+    def _wait_for_db_ready(
+        self,
+        pod: str,
+        ns: str,
+        check_cmd: List[str],
+        label: str,
+        stop: Optional[threading.Event] = None,
+    ) -> bool:
+        """Poll until a database pod is Ready and check_cmd succeeds in it.
+
+        Returns False if that has not happened within 60s, or once ``stop`` is
+        set (checked before each attempt).
+        """
+
+        def ready() -> bool:
+            try:
+                # Check if the pod exists and is Ready (one API GET on the
+                # cached client; a missing pod raises and counts as not ready)
+                status = self._core_v1().read_namespaced_pod(pod, ns).status
+                if not any(
+                    c.type == "Ready" and c.status == "True"
+                    for c in status.conditions or []
+                ):
+                    return False
+                # Pod exists and is Ready, now verify the database is responding
+                check_result = self.run_cmd(
+                    ["kubectl", "exec", "-n", ns, pod, "--", *check_cmd],
+                    capture_output=True,
+                    check=False,
+                )
+                return check_result.returncode == 0
+            except Exception:
+                return False
+
+        stopped = stop.is_set if stop is not None else lambda: False
+        # A stop request ends the poll like a success; it is told apart below.
+        if not poll(lambda: stopped() or ready(), budget=60.0) or stopped():
+            return False
+        self.log(f"   ✅ {label} is ready for connections")
+        return True
+
     def cmd_cluster_destroy(self):
         self.log(f"🗑️  Destroying Kind cluster '{CLUSTER_NAME}'...")
         self.run_cmd(["kind", "delete", "cluster", "--name", CLUSTER_NAME], check=False)
         self.log("✅ Cluster destroyed successfully.")
 
     def get_cluster_creds(self) -> Dict[str, Any]:
+        """Return connection details for the in-cluster services.
+
+        Passwords are read from their secrets once per process and cached;
+        cmd_cluster_create drops the cache since it may (re)create them.
+        Callers must treat the returned dict as read-only.
+        """
+        if self._creds_cache is not None:
+            return self._creds_cache
+
         creds = {
             "s3": {
                 "endpoint": "http://garage.garage.svc.cluster.local:3900",
@@ -886,60 +1074,29 @@ spec:
         }
 
         # Fetch dynamic passwords
+        dynamic = [
+            ("postgresql", "pg17-ncps-app"),
+            ("mariadb", "mariadb-ncps-password"),
+            ("redis", "redis-ncps"),
+        ]
         try:
-            pg_pass_b64 = self.run_cmd(
-                [
-                    "kubectl",
-                    "get",
-                    "secret",
-                    "-n",
-                    "data",
-                    "pg17-ncps-app",
-                    "-o",
-                    "jsonpath={.data.password}",
-                ],
-                capture_output=True,
-            ).stdout
-            if pg_pass_b64:
-                creds["postgresql"]["password"] = base64.b64decode(pg_pass_b64).decode()
-
-            maria_pass_b64 = self.run_cmd(
-                [
-                    "kubectl",
-                    "get",
-                    "secret",
-                    "-n",
-                    "data",
-                    "mariadb-ncps-password",
-                    "-o",
-                    "jsonpath={.data.password}",
-                ],
-                capture_output=True,
-            ).stdout
-            if maria_pass_b64:
-                creds["mariadb"]["password"] = base64.b64decode(maria_pass_b64).decode()
-
-            redis_pass_b64 = self.run_cmd(
-                [
-                    "kubectl",
-                    "get",
-                    "secret",
-                    "-n",
-                    "data",
-                    "redis-ncps",
-                    "-o",
-                    "jsonpath={.data.password}",
-                ],
-                capture_output=True,
-                check=False,
-            ).stdout
-            if redis_pass_b64:
-                creds["redis"]["password"] = base64.b64decode(redis_pass_b64).decode()
-        except (subprocess.CalledProcessError, base64.binascii.Error, IndexError) as e:
+            for section, secret_name in dynamic:
+                try:
+                    password = self._read_secret("data", secret_name, "password")
+                except client.exceptions.ApiException as e:
+                    # Redis may run without a password secret.
+                    if section == "redis" and e.status == 404:
+                        continue
+                    raise
+                if password:
+                    creds[section]["password"] = password
+        except Exception as e:
             self.log(
                 f"   ⚠️  Could not fetch dynamic credentials, proceeding with defaults. Error: {e}"
             )
+            return creds
 
+        self._creds_cache = creds
         return creds
 
     def cmd_cluster_info(self, json_output: bool = False):
@@ -974,37 +1131,69 @@ spec:
 
     def _get_nix_platform(self) -> str:
         """Determine the Nix platform to build for based on host OS and architecture."""
-        system = os.uname().sysname.lower()
-        machine = os.uname().machine.lower()
-
-        platform_map = {
-            ("darwin", "arm64"): "aarch64-linux",
-            ("darwin", "x86_64"): "x86_64-linux",
-            ("linux", "arm64"): "aarch64-linux",
-            ("linux", "aarch64"): "aarch64-linux",
-            ("linux", "x86_64"): "x86_64-linux",
-            ("linux", "amd64"): "x86_64-linux",
-        }
+        uname = os.uname()
+        system = uname.sysname.lower()
+        machine = uname.machine.lower()
 
-        if (system, machine) in platform_map:
-            return platform_map[(system, machine)]
+        nix_platform = NIX_PLATFORMS.get((system, machine))
+        if nix_platform is None:
+            self.error(f"Unsupported OS/architecture combination: {system}/{machine}")
+        return nix_platform
 
-        self.error(f"Unsupported OS/architecture combination: {system}/{machine}")
+    def _build_image(self) -> Tuple[str, str, str]:
+        """Build the Docker image with Nix and load it into the local daemon.
+
+        Needs neither the cluster nor its registry, so cmd_all runs it while
+        the cluster comes up. Returns (nix platform, archive path, image name).
+        """
+        nix_platform = self._get_nix_platform()
+        self.log(f"🔨 Building Docker image with Nix for {nix_platform}...")
+        build_path = self.run_cmd(
+            [
+                "nix",
+                "build",
+                f"{REPO_ROOT}#packages.{nix_platform}.docker",
+                "--print-out-paths",
+                "--no-link",
+            ],
+            capture_output=True,
+        ).stdout.strip()
+
+        self.log("📦 Loading image into Docker...")
+        # Let docker read the archive itself rather than piping it through us.
+        load_output = self.run_cmd(
+            ["docker", "load", "-i", build_path], capture_output=True
+        ).stdout
+        self.log(load_output)
+
+        # Loaded image: 127.0.0.1:30000/ncps:p8xwc56qrjpbfssbfz7vwxs0n028sqav
+        for line in load_output.splitlines():
+            if line.startswith("Loaded image: "):
+                nix_image = line[len("Loaded image: ") :].strip()
+                break
+        else:
+            self.error("Could not determine loaded image name.")
+        return nix_platform, build_path, nix_image
 
     def cmd_generate(
-        self, push: bool, last: bool, tag: Optional[str], registry: str, repository: str
+        self,
+        push: bool,
+        last: bool,
+        tag: Optional[str],
+        registry: str,
+        repository: str,
+        built_image: Optional[Tuple[str, str, str]] = None,
     ):
+        """Generate test values; with `push`, build (or take `built_image`) and push."""
         image_tag = tag
 
         if last:
-            state_file = os.path.join(TEST_VALUES_DIR, ".last_image_state.json")
-
-            if not os.path.exists(state_file):
+            if not os.path.exists(IMAGE_STATE_FILE):
                 self.error(
                     "No image state found. Run 'k8s-tests generate --push' first to build and track image."
                 )
 
-            with open(state_file, "r") as f:
+            with open(IMAGE_STATE_FILE, "r") as f:
                 state = json.load(f)
 
             image_tag = state["image_tag"]
@@ -1038,32 +1227,8 @@ spec:
 
                 self.log(f"✅ Successfully pushed {full_image}")
         elif push:
-            nix_platform = self._get_nix_platform()
-            self.log(f"🔨 Building Docker image with Nix for {nix_platform}...")
-            build_path = self.run_cmd(
-                [
-                    "nix",
-                    "build",
-                    f"{REPO_ROOT}#packages.{nix_platform}.docker",
-                    "--print-out-paths",
-                    "--no-link",
-                ],
-                capture_output=True,
-            ).stdout.strip()
-
-            self.log("📦 Loading image into Docker...")
-            with open(build_path, "rb") as f:
-                load_output = self.run_cmd(
-                    ["docker", "load"], stdin=f, capture_output=True, text=False
-                ).stdout.decode()
-            self.log(load_output)
-
-            # Loaded image: 127.0.0.1:30000/ncps:p8xwc56qrjpbfssbfz7vwxs0n028sqav
-            match = re.search(r"Loaded image: (.+)", load_output)
-            if not match:
-                self.error("Could not determine loaded image name.")
-            nix_image = match.group(1)
-            image_tag = nix_image.split(":")[-1]
+            nix_platform, build_path, nix_image = built_image or self._build_image()
+            image_tag = nix_image.rpartition(":")[2]
 
             self.log("📤 Pushing image to local registry...")
             full_image = f"{registry}/{repository}:{image_tag}"
@@ -1083,14 +1248,17 @@ spec:
             state = {
                 "image_tag": image_tag,
                 "nix_store_path": build_path,  # Path to docker-archive tarball
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                 "platform": nix_platform,
             }
 
-            state_file = os.path.join(TEST_VALUES_DIR, ".last_image_state.json")
             os.makedirs(TEST_VALUES_DIR, exist_ok=True)
-            with open(state_file, "w") as f:
+            # Write-then-rename so an interrupted write never leaves a
+            # truncated state file for `generate --last` to trip over.
+            tmp_state_file = IMAGE_STATE_FILE + ".tmp"
+            with open(tmp_state_file, "w") as f:
                 json.dump(state, f, indent=2)
+            os.replace(tmp_state_file, IMAGE_STATE_FILE)
 
         if not image_tag:
             self.error("Image tag required.")
@@ -1108,73 +1276,35 @@ spec:
             }
         )
 
-        nix_eval_cmd = [
-            "nix",
-            "eval",
-            "--json",
-            "--file",
-            self.config_file,
-            "generateValues",
-            "--apply",
-            f"f: f (builtins.fromJSON ''{args_json}'')",
-        ]
-        values_json = json.loads(self.run_cmd(nix_eval_cmd, capture_output=True).stdout)
+        # The values, permutations and test data hashes come from one evaluation.
+        nix_config = self._nix_config(args_json)
+        values_json = nix_config["values"]
 
         for name, config in values_json.items():
             self.log(f"  Generating {name}.yaml...")
             with open(os.path.join(TEST_VALUES_DIR, f"{name}.yaml"), "w") as f:
                 f.write("# Auto-generated from config.nix\n")
-                yaml.dump(config, f, sort_keys=False)
+                yaml.dump(config, f, Dumper=YAML_DUMPER, sort_keys=False)
 
         # Generate setup scripts for existing-secret permutations
-        permutations = json.loads(
-            self.run_cmd(
-                ["nix", "eval", "--json", "--file", self.config_file, "permutations"],
-                capture_output=True,
-            ).stdout
-        )
+        permutations = nix_config["permutations"]
 
         # Generate test-config.yaml
         self._generate_test_config(creds, permutations)
 
         self.log(f"✅ All test files generated in: {TEST_VALUES_DIR}")
 
-    def _create_external_secret(self, name: str, creds: Dict[str, Any], db_type: str):
-        """Create external secret for a deployment directly using kubectl."""
+    def _external_secret_manifest(
+        self, name: str, creds: Dict[str, Any], db_type: str
+    ) -> str:
+        """Render the namespace and external secret of a deployment as YAML."""
         namespace = f"ncps-{name}"
-
-        # Create namespace
-        self.run_cmd(
-            [
-                "kubectl",
-                "create",
-                "namespace",
-                namespace,
-                "--dry-run=client",
-                "-o",
-                "yaml",
-            ],
-            capture_output=True,
-            check=False,
-        )
-        self.run_cmd(
-            ["kubectl", "apply", "-f", "-"],
-            input=self.run_cmd(
-                [
-                    "kubectl",
-                    "create",
-                    "namespace",
-                    namespace,
-                    "--dry-run=client",
-                    "-o",
-                    "yaml",
-                ],
-                capture_output=True,
-            ).stdout,
+        namespace_yaml = (
+            f"apiVersion: v1\nkind: Namespace\nmetadata:\n  name: {namespace}\n"
         )
 
         # Build database URL with per-test database name
-        db_name = f"ncps_{name.replace('-', '_')}"
+        db_name = scenario_database_name(name)
         db_url = ""
         if db_type == "postgresql":
             p = creds["postgresql"]
@@ -1187,42 +1317,31 @@ spec:
                 f"mysql://{m['username']}:{pass_enc}@{m['host']}:{m['port']}/{db_name}"
             )
 
-        # Create secret
-        secret_yaml = self.run_cmd(
-            [
-                "kubectl",
-                "create",
-                "secret",
-                "generic",
-                "ncps-external-secrets",
-                "--namespace",
-                namespace,
-                "--from-literal=access-key-id=" + creds["s3"]["access_key"],
-                "--from-literal=secret-access-key=" + creds["s3"]["secret_key"],
-                "--from-literal=database-url=" + db_url,
-                "--dry-run=client",
-                "-o",
-                "yaml",
-            ],
-            capture_output=True,
-        ).stdout
+        # Render secret
+        secret_data = {
+            "access-key-id": creds["s3"]["access_key"],
+            "secret-access-key": creds["s3"]["secret_key"],
+            "database-url": db_url,
+        }
+        secret_yaml = yaml.dump(
+            {
+                "apiVersion": "v1",
+                "kind": "Secret",
+                "metadata": {"name": "ncps-external-secrets", "namespace": namespace},
+                "type": "Opaque",
+                "data": {
+                    k: base64.b64encode(v.encode()).decode()
+                    for k, v in secret_data.items()
+                },
+            },
+            Dumper=YAML_DUMPER,
+            sort_keys=False,
+        )
 
-        self.run_cmd(["kubectl", "apply", "-f", "-"], input=secret_yaml)
+        return namespace_yaml + "---\n" + secret_yaml
 
     def _generate_test_config(self, creds, permutations):
-        test_data_hashes = json.loads(
-            self.run_cmd(
-                [
-                    "nix",
-                    "eval",
-                    "--json",
-                    "--file",
-                    self.config_file,
-                    "testData.narinfo_hashes",
-                ],
-                capture_output=True,
-            ).stdout
-        )
+        test_data_hashes = self._nix_config()["narinfo_hashes"]
 
         test_config = {
             "cluster": creds,
@@ -1263,42 +1382,47 @@ spec:
 
         with open(os.path.join(TEST_VALUES_DIR, "test-config.yaml"), "w") as f:
             f.write("# NCPS Test Configuration\n# Auto-generated by k8s-tests\n")
-            yaml.dump(test_config, f, sort_keys=False)
+            yaml.dump(test_config, f, Dumper=YAML_DUMPER, sort_keys=False)
 
     # --- Deployment Management ---
 
-    def cmd_install(self, name: Optional[str]):
+    def cmd_install(self, name: Optional[str], concurrency: int = 4):
         if not os.path.exists(TEST_VALUES_DIR):
             self.error("Test values not generated. Run 'k8s-tests generate' first.")
 
         # Load permutations to check which deployments need external secrets
-        permutations = json.loads(
-            self.run_cmd(
-                ["nix", "eval", "--json", "--file", self.config_file, "permutations"],
-                capture_output=True,
-            ).stdout
-        )
-        perm_map = {p["name"]: p for p in permutations}
+        perm_map = self._permutations_by_name()
         creds = self.get_cluster_creds()
 
-        names = (
-            [name]
-            if name
-            else [
-                f[:-5]
-                for f in os.listdir(TEST_VALUES_DIR)
-                if f.endswith(".yaml") and f not in ["test-config.yaml"]
-            ]
-        )
-
-        for n in sorted(names):
-            self.log(f"📦 Installing ncps-{n}...")
+        if name:
+            names = [name]
+        else:
+            with os.scandir(TEST_VALUES_DIR) as entries:
+                names = sorted(
+                    e.name[:-5]
+                    for e in entries
+                    if e.name.endswith(".yaml")
+                    and e.name != "test-config.yaml"
+                    and e.is_file(follow_symlinks=False)
+                )
 
-            # Create external secret if needed
-            if n in perm_map and perm_map[n].get("setupScript"):
-                db_type = perm_map[n]["database"]["type"]
-                self._create_external_secret(n, creds, db_type)
+        # Create every external secret (and its namespace) in one apply
+        secret_manifests = [
+            self._external_secret_manifest(n, creds, perm_map[n]["database"]["type"])
+            for n in names
+            if n in perm_map and perm_map[n].get("setupScript")
+        ]
+        if secret_manifests:
+            self.log(f"🔑 Creating {len(secret_manifests)} external secret(s)...")
+            # Server-side apply: the API server merges, so kubectl skips the
+            # client-side diff and the last-applied annotation per object.
+            self.run_cmd(
+                ["kubectl", "apply", "--server-side", "-f", "-"],
+                input="---\n".join(secret_manifests),
+            )
 
+        def install(n: str):
+            self.log(f"📦 Installing ncps-{n}...")
             values_file = os.path.join(TEST_VALUES_DIR, f"{n}.yaml")
             self.run_cmd(
                 [
@@ -1315,6 +1439,13 @@ spec:
                 ]
             )
 
+        # Each release lives in its own namespace, so the helm invocations are
+        # independent; concurrency 0 means one worker per release.
+        self._run_parallel(
+            [lambda n=n: install(n) for n in names],
+            concurrency or len(names),
+        )
+
         self.log("✅ All deployments installed")
 
     def _cleanup_databases(self, perm_names: list[str]):
@@ -1322,141 +1453,109 @@ spec:
         if not perm_names:
             return
 
-        creds = self.get_cluster_creds()
-
-        # Load permutations from Nix config
-        permutations = json.loads(
-            self.run_cmd(
-                ["nix", "eval", "--json", "--file", self.config_file, "permutations"],
-                capture_output=True,
-            ).stdout
-        )
-
-        # PostgreSQL cleanup
+        perm_map = self._permutations_by_name()
         pg_databases = []
+        mariadb_databases = []
         for name in perm_names:
-            # Check if this permutation uses PostgreSQL
-            for perm in permutations:
-                if (
-                    perm["name"] == name
-                    and perm.get("database", {}).get("type") == "postgresql"
-                ):
-                    db_name = f"ncps_{name.replace('-', '_')}"
-                    pg_databases.append(db_name)
-                    break
+            db_type = (perm_map.get(name) or {}).get("database", {}).get("type")
+            if db_type == "postgresql":
+                pg_databases.append(scenario_database_name(name))
+            elif db_type == "mysql":
+                mariadb_databases.append(scenario_database_name(name))
+
+        # The engines are independent; drop from both at once.
+        self._run_parallel(
+            [
+                lambda: self._drop_pg_databases(sorted(set(pg_databases))),
+                lambda: self._drop_mariadb_databases(sorted(set(mariadb_databases))),
+            ],
+            2,
+        )
 
-        for db_name in sorted(set(pg_databases)):
-            try:
-                self.log(f"   - Dropping PostgreSQL database: {db_name}")
-                self.run_cmd(
-                    [
-                        "kubectl",
-                        "exec",
-                        "-n",
-                        "data",
-                        "pg17-ncps-1",
-                        "--",
-                        "psql",
-                        "-U",
-                        "postgres",
-                        "-c",
-                        f"DROP DATABASE IF EXISTS {db_name};",
-                    ],
-                    check=False,
-                )
-            except Exception as e:
-                self.log(f"   ⚠️  Failed to drop PostgreSQL database {db_name}: {e}")
+    def _drop_pg_databases(self, db_names: List[str]):
+        """Drop PostgreSQL databases in one psql session, logging failures.
 
-        # MariaDB cleanup
-        mariadb_databases = []
-        for name in perm_names:
-            # Check if this permutation uses MariaDB
-            for perm in permutations:
-                if (
-                    perm["name"] == name
-                    and perm.get("database", {}).get("type") == "mysql"
-                ):
-                    db_name = f"ncps_{name.replace('-', '_')}"
-                    mariadb_databases.append(db_name)
-                    break
+        The drops go through a stdin script rather than a single -c, which
+        psql would run as one transaction and which DROP DATABASE refuses;
+        without ON_ERROR_STOP one failure does not stop the rest.
+        """
+        if not db_names:
+            return
+        pg_script = []
+        for db_name in db_names:
+            self.log(f"   - Dropping PostgreSQL database: {db_name}")
+            pg_script.append(f"DROP DATABASE IF EXISTS {db_name};")
+        try:
+            self._psql("-f", "-", input="\n".join(pg_script) + "\n", check=False)
+        except Exception as e:
+            self.log(f"   ⚠️  Failed to drop PostgreSQL databases: {e}")
 
-        if mariadb_databases:
-            try:
-                mariadb_root_password_b64 = self.run_cmd(
-                    [
-                        "kubectl",
-                        "get",
-                        "secret",
-                        "-n",
-                        "data",
-                        "mariadb-root-password",
-                        "-o",
-                        "jsonpath={.data.password}",
-                    ],
-                    capture_output=True,
-                ).stdout
-                mariadb_root_password = base64.b64decode(
-                    mariadb_root_password_b64
-                ).decode()
-
-                for db_name in sorted(set(mariadb_databases)):
-                    try:
-                        self.log(f"   - Dropping MariaDB database: {db_name}")
-                        self.run_cmd(
-                            [
-                                "kubectl",
-                                "exec",
-                                "-n",
-                                "data",
-                                "mariadb-ncps-0",
-                                "--",
-                                "mariadb",
-                                "-u",
-                                "root",
-                                f"-p{mariadb_root_password}",
-                                "-e",
-                                f"DROP DATABASE IF EXISTS {db_name};",
-                            ],
-                            check=False,
-                        )
-                    except Exception as e:
-                        self.log(
-                            f"   ⚠️  Failed to drop MariaDB database {db_name}: {e}"
-                        )
-            except Exception as e:
-                self.log(f"   ⚠️  Failed to get MariaDB root password: {e}")
+    def _drop_mariadb_databases(self, db_names: List[str]):
+        """Drop MariaDB databases in one mariadb session, logging failures."""
+        if not db_names:
+            return
+        try:
+            mariadb_root_password = self._read_secret(
+                "data", "mariadb-root-password", "password"
+            )
+
+            mariadb_script = []
+            for db_name in db_names:
+                self.log(f"   - Dropping MariaDB database: {db_name}")
+                mariadb_script.append(f"DROP DATABASE IF EXISTS {db_name};")
+            # --force keeps going past a failed statement, like psql does.
+            self._mariadb(
+                mariadb_root_password,
+                "--force",
+                input="\n".join(mariadb_script) + "\n",
+                check=False,
+            )
+        except Exception as e:
+            self.log(f"   ⚠️  Failed to drop MariaDB databases: {e}")
+
+    def _uninstall_one(self, ns: str):
+        """Uninstall a test release and start deleting its namespace.
+
+        The namespace DELETE returns as soon as it is accepted; cmd_cleanup
+        waits for every namespace to finish terminating afterwards.
+        """
+        self.log(f"  Removing {ns}...")
+        self.run_cmd(["helm", "uninstall", ns, "-n", ns], check=False)
+        try:
+            self._core_v1().delete_namespace(ns)
+        except client.exceptions.ApiException as e:
+            if e.status != 404:
+                self.log(f"   ⚠️  Failed to delete namespace {ns}: {e.reason}")
 
     def cmd_cleanup(self, name: Optional[str]):
-        perm_names = []
+        # Namespace reads and deletes go through the cached API client (one
+        # keep-alive connection pool) rather than a kubectl fork each.
+        core_v1 = self._core_v1()
         if name:
             self.log(f"🧹 Removing {name}...")
-            perm_names = [name]
-            self.run_cmd(
-                ["helm", "uninstall", f"ncps-{name}", "-n", f"ncps-{name}"], check=False
-            )
-            self.run_cmd(
-                ["kubectl", "delete", "namespace", f"ncps-{name}"], check=False
-            )
+            namespaces = [f"ncps-{name}"]
         else:
             self.log("🧹 Cleaning up all test deployments...")
-            ns_list = self.run_cmd(
-                [
-                    "kubectl",
-                    "get",
-                    "namespaces",
-                    "-o",
-                    "jsonpath={.items[*].metadata.name}",
-                ],
-                capture_output=True,
-            ).stdout.split()
-            for ns in ns_list:
-                if ns.startswith("ncps-"):
-                    self.log(f"  Removing {ns}...")
-                    perm_name = ns.replace("ncps-", "")
-                    perm_names.append(perm_name)
-                    release = ns  # typically same
-                    self.run_cmd(["helm", "uninstall", ns, "-n", ns], check=False)
-                    self.run_cmd(["kubectl", "delete", "namespace", ns], check=False)
+            namespaces = [
+                ns.metadata.name
+                for ns in core_v1.list_namespace().items
+                if ns.metadata.name.startswith("ncps-")
+            ]
+        perm_names = [ns[len("ncps-") :] for ns in namespaces]
+
+        if namespaces:
+            # Namespace finalizers take tens of seconds to drain; overlap them
+            # instead of paying for each namespace in turn.
+            self._run_parallel(
+                [lambda ns=ns: self._uninstall_one(ns) for ns in namespaces], 8
+            )
+
+            def all_deleted() -> bool:
+                remaining = {ns.metadata.name for ns in core_v1.list_namespace().items}
+                return remaining.isdisjoint(namespaces)
+
+            if not poll(all_deleted, budget=300.0):
+                self.log("   ⚠️  Timed out waiting for namespaces to terminate")
 
         # Cleanup databases
         if perm_names:
@@ -1467,7 +1566,7 @@ spec:
 
     # --- Testing (bridged from test-deployments.py logic) ---
 
-    def cmd_test(self, name: Optional[str]):
+    def cmd_test(self, name: Optional[str], parallel: int = 1):
         config_path = os.path.join(TEST_VALUES_DIR, "test-config.yaml")
         if not os.path.exists(config_path):
             self.error("test-config.yaml not found. Run 'k8s-tests generate' first.")
@@ -1481,7 +1580,7 @@ spec:
         )
 
         tester = NCPSTester(config_path, verbose=self.verbose)
-        results = tester.test_all_deployments(deployment_filter=name)
+        results = tester.test_all_deployments(deployment_filter=name, parallel=parallel)
         if not results:
             self.error("No deployments tested")
         success = tester.print_summary(results)
@@ -1490,13 +1589,43 @@ spec:
 
     def cmd_all(self):
         self.log("🚀 Running complete workflow...")
+        # The Nix image build is the slowest part of generate and needs no
+        # cluster, so it runs while the cluster comes up; only the registry
+        # push and the values (which embed cluster credentials) wait for it.
+        # It runs on a daemon thread rather than an executor, whose workers
+        # interpreter shutdown joins: if cluster create fails, self.error()
+        # exits straight away instead of waiting minutes for nix build and
+        # docker load. Its log lines are buffered and replayed once it is
+        # done, so they don't interleave with cluster create's.
+        image_build: Future = Future()
+        build_output: List[str] = []
+
+        def build():
+            error = None
+            with captured_stdout() as output:
+                try:
+                    result = self._build_image()
+                except BaseException as e:  # incl. SystemExit from self.error()
+                    error = e
+            build_output.append(output.getvalue())
+            if error is None:
+                image_build.set_result(result)
+            else:
+                image_build.set_exception(error)
+
+        threading.Thread(target=build, name="image-build", daemon=True).start()
         self.cmd_cluster_create()
+        try:
+            built_image = image_build.result()
+        finally:
+            sys.stdout.write("".join(build_output))
         self.cmd_generate(
             push=True,
             last=False,
             tag=None,
             registry="localhost:30000",
             repository="ncps",
+            built_image=built_image,
         )
         self.cmd_install(name=None)
         self.cmd_test(name=None)
@@ -1512,8 +1641,13 @@ def main():
     # Cluster
     cluster_parser = subparsers.add_parser("cluster")
     cluster_sub = cluster_parser.add_subparsers(dest="subcommand")
-    cluster_sub.add_parser("create").set_defaults(
-        func=lambda cli, _: cli.cmd_cluster_create()
+    create_p = cluster_sub.add_parser("create")
+    create_p.add_argument("--helm-concurrency", type=int, default=4, metavar="N")
+    create_p.add_argument("--install-concurrency", type=int, default=4, metavar="N")
+    create_p.set_defaults(
+        func=lambda cli, args: cli.cmd_cluster_create(
+            args.helm_concurrency, args.install_concurrency
+        )
     )
     cluster_sub.add_parser("destroy").set_defaults(
         func=lambda cli, _: cli.cmd_cluster_destroy()
@@ -1538,13 +1672,17 @@ def main():
     # Install
     inst_p = subparsers.add_parser("install")
     inst_p.add_argument("name", nargs="?")
-    inst_p.set_defaults(func=lambda cli, args: cli.cmd_install(args.name))
+    inst_p.add_argument("--concurrency", type=int, default=4, metavar="N")
+    inst_p.set_defaults(
+        func=lambda cli, args: cli.cmd_install(args.name, args.concurrency)
+    )
 
     # Test
     test_p = subparsers.add_parser("test")
     test_p.add_argument("name", nargs="?")
     test_p.add_argument("-v", "--verbose", action="store_true")
-    test_p.set_defaults(func=lambda cli, args: cli.cmd_test(args.name))
+    test_p.add_argument("-j", "--parallel", type=int, default=1, metavar="N")
+    test_p.set_defaults(func=lambda cli, args: cli.cmd_test(args.name, args.parallel))
 
     # Cleanup
     clean_p = subparsers.add_parser("cleanup")
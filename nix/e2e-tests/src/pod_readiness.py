@@ -0,0 +1,109 @@
+"""Incremental pod-readiness bookkeeping for kubernetes validation.
+
+Dependency-free (duck-typed on the ``kubernetes`` client's ``V1Pod`` shape) so it
+stays unit-testable under the pytest-only harness check.
+
+Rationale: ``_test_pods`` used to recompute
+``all(all(cs.ready for cs in ...) for pod in running_pods)`` on every poll tick,
+re-walking every container of every pod even when nothing changed. The tracker
+keys each pod by ``uid`` and re-evaluates readiness only when the pod's
+``resourceVersion`` moves, so a poll (or a watch event) costs O(changed pods).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Set
+
+
+def pod_is_ready(pod) -> bool:
+    """True when the pod is Running and every container reports ready."""
+    status = pod.status
+    return status.phase == "Running" and all(
+        cs.ready for cs in status.container_statuses or []
+    )
+
+
+# Waiting reasons the kubelet does not recover from without a spec change.
+FATAL_WAITING_REASONS = frozenset(
+    {
+        "CreateContainerConfigError",
+        "ErrImageNeverPull",
+        "ImagePullBackOff",
+        "InvalidImageName",
+    }
+)
+
+# A first crash can be a dependency that was not up yet; only treat
+# CrashLoopBackOff as fatal once the container has kept failing.
+CRASH_LOOP_RESTARTS = 3
+
+
+def fatal_container_state(pod) -> Optional[str]:
+    """Describe a container stuck in a state it will not leave, or None."""
+    status = pod.status
+    statuses = list(getattr(status, "init_container_statuses", None) or [])
+    statuses += status.container_statuses or []
+    for cs in statuses:
+        waiting = cs.state.waiting if cs.state else None
+        if waiting is None:
+            continue
+        if waiting.reason in FATAL_WAITING_REASONS or (
+            waiting.reason == "CrashLoopBackOff"
+            and (cs.restart_count or 0) >= CRASH_LOOP_RESTARTS
+        ):
+            problem = f"{pod.metadata.name}/{cs.name}: {waiting.reason}"
+            if waiting.message:
+                problem += f" - {waiting.message}"
+            return problem
+    return None
+
+
+class PodReadinessTracker:
+    """Tracks which pods are Running and which are fully ready, by uid."""
+
+    def __init__(self):
+        self._versions: Dict[str, str] = {}
+        self.running: Set[str] = set()
+        self.ready: Set[str] = set()
+
+    def observe(self, pod) -> None:
+        """Record the latest state of one pod (an ADDED/MODIFIED event)."""
+        uid = pod.metadata.uid
+        version = pod.metadata.resource_version
+        if version is not None and self._versions.get(uid) == version:
+            return
+        self._versions[uid] = version
+        if pod.status.phase == "Running":
+            self.running.add(uid)
+        else:
+            self.running.discard(uid)
+        if pod_is_ready(pod):
+            self.ready.add(uid)
+        else:
+            self.ready.discard(uid)
+
+    def forget(self, pod) -> None:
+        """Drop a pod that no longer exists (a DELETED event)."""
+        uid = pod.metadata.uid
+        self._versions.pop(uid, None)
+        self.running.discard(uid)
+        self.ready.discard(uid)
+
+    def sync(self, pods: Iterable) -> None:
+        """Reconcile against a full pod listing, forgetting vanished pods."""
+        present = set()
+        for pod in pods:
+            present.add(pod.metadata.uid)
+            self.observe(pod)
+        for uid in set(self._versions) - present:
+            self._versions.pop(uid, None)
+            self.running.discard(uid)
+            self.ready.discard(uid)
+
+    def all_seen_ready(self) -> bool:
+        """True when at least one pod is tracked and every tracked pod is ready."""
+        return bool(self._versions) and len(self.ready) == len(self._versions)
+
+    def all_ready(self, expected: int) -> bool:
+        """True when exactly ``expected`` pods run and all of them are ready."""
+        return len(self.running) == expected and self.ready == self.running
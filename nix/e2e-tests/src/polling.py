@@ -0,0 +1,85 @@
+"""Exponential-backoff polling for cluster bring-up and validation waits.
+
+Dependency-injected (``sleep`` and ``clock`` are parameters) so it stays
+unit-testable under the pytest-only harness check.
+
+Rationale: the readiness loops used to poll on a fixed 2s grid (``for _ in
+range(30): ...; time.sleep(2)``). A resource that becomes ready 100ms after a
+check then still costs up to 2s, and the fixed attempt count couples the total
+budget to the interval. ``poll`` starts with short intervals that grow
+geometrically to a cap, and stops on a wall-clock budget instead of an attempt
+count.
+"""
+
+from __future__ import annotations
+
+import socket
+import time
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def poll(
+    fn: Callable[[], T],
+    *,
+    initial: float = 0.25,
+    mult: float = 1.5,
+    cap: float = 5.0,
+    budget: float = 180.0,
+    sleep=time.sleep,
+    clock=time.monotonic,
+) -> Optional[T]:
+    """Call ``fn`` until it returns a truthy value or ``budget`` seconds pass.
+
+    Returns the first truthy result, or ``None`` once the budget is spent (``fn``
+    is always called at least once, and once more at the deadline). Sleeps
+    ``initial * mult**i`` seconds between attempts, capped at ``cap`` and never
+    past the deadline. Exceptions from ``fn`` propagate.
+    """
+    deadline = clock() + budget
+    delay = initial
+    while True:
+        result = fn()
+        if result:
+            return result
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return None
+        sleep(min(delay, cap, remaining))
+        delay *= mult
+
+
+def _accepts_connections(host: str, port: int) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=0.1):
+            return True
+    except OSError:
+        return False
+
+
+def wait_for_port(
+    port: int,
+    *,
+    host: str = "127.0.0.1",
+    budget: float = 5.0,
+    sleep=time.sleep,
+    clock=time.monotonic,
+) -> bool:
+    """Wait until ``host:port`` accepts a TCP connection; False once ``budget`` passes.
+
+    Meant for a freshly spawned ``kubectl port-forward``, which binds its local
+    port only after the tunnel to the API server is up. On a warm cluster that is
+    a few hundred milliseconds, so probing starts at 20ms and backs off to 250ms.
+    """
+    return bool(
+        poll(
+            lambda: _accepts_connections(host, port),
+            initial=0.02,
+            mult=2.0,
+            cap=0.25,
+            budget=budget,
+            sleep=sleep,
+            clock=clock,
+        )
+    )
@@ -0,0 +1,60 @@
+"""Per-thread stdout capture for running deployment validations concurrently.
+
+Stdlib-only so it stays unit-testable under the pytest-only harness check.
+
+Rationale: ``NCPSTester`` reports progress with bare ``print()`` calls from deep
+inside each check. Running several deployments on worker threads would
+interleave those lines into an unreadable stream, and
+``contextlib.redirect_stdout`` swaps the process-wide ``sys.stdout`` so it cannot
+separate threads. ``captured_stdout`` instead installs (once) a routing stand-in
+for ``sys.stdout`` that sends a capturing thread's writes to its own buffer and
+passes every other thread's writes through unchanged, so each deployment's report
+can be printed whole once it finishes.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class _ThreadRoutedStream:
+    """``sys.stdout`` stand-in that diverts writes from capturing threads."""
+
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+
+    def _current(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self._target if buffer is None else buffer
+
+    def write(self, s: str) -> int:
+        return self._current().write(s)
+
+    def flush(self) -> None:
+        self._current().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+_install_lock = threading.Lock()
+
+
+@contextmanager
+def captured_stdout() -> Iterator[io.StringIO]:
+    """Collect everything the current thread prints into a ``StringIO``."""
+    with _install_lock:
+        stream = sys.stdout
+        if not isinstance(stream, _ThreadRoutedStream):
+            stream = sys.stdout = _ThreadRoutedStream(stream)
+    buffer = io.StringIO()
+    stream._local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        stream._local.buffer = None
@@ -0,0 +1,108 @@
+"""Unit tests for the incremental pod-readiness tracker.
+
+Pods are faked with ``SimpleNamespace`` in the ``kubernetes`` client's ``V1Pod``
+shape, so these run under the pytest-only ``e2e-harness-unit`` check.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pod_readiness
+from pod_readiness import PodReadinessTracker
+
+
+def _pod(uid, phase="Running", ready=(True,), rv="1"):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(uid=uid, resource_version=rv),
+        status=SimpleNamespace(
+            phase=phase,
+            container_statuses=[SimpleNamespace(ready=r) for r in ready],
+        ),
+    )
+
+
+def test_pod_is_ready_requires_running_and_all_containers():
+    assert pod_readiness.pod_is_ready(_pod("a"))
+    assert not pod_readiness.pod_is_ready(_pod("a", phase="Pending"))
+    assert not pod_readiness.pod_is_ready(_pod("a", ready=(True, False)))
+
+
+def test_all_ready_needs_exact_replica_count():
+    t = PodReadinessTracker()
+    t.sync([_pod("a"), _pod("b", ready=(False,))])
+    assert not t.all_ready(2)
+    t.observe(_pod("b", rv="2"))
+    assert t.all_ready(2)
+    assert not t.all_ready(3)
+
+
+def test_unchanged_resource_version_is_not_reevaluated():
+    t = PodReadinessTracker()
+    t.observe(_pod("a", ready=(False,), rv="1"))
+    # Same resourceVersion: the cached verdict stands even if the object differs.
+    t.observe(_pod("a", ready=(True,), rv="1"))
+    assert t.ready == set()
+
+
+def test_sync_and_forget_drop_vanished_pods():
+    t = PodReadinessTracker()
+    t.sync([_pod("a"), _pod("b")])
+    t.sync([_pod("a")])
+    assert t.running == {"a"}
+    t.forget(_pod("a"))
+    assert t.running == set() and t.ready == set()
+
+
+def test_all_seen_ready_waits_for_every_tracked_pod():
+    t = PodReadinessTracker()
+    assert not t.all_seen_ready()
+    t.observe(_pod("a"))
+    t.observe(_pod("b", phase="Pending", ready=()))
+    assert not t.all_seen_ready()
+    t.forget(_pod("b"))
+    assert t.all_seen_ready()
+
+
+def _waiting_pod(reason, restarts=0, message=None, init=False):
+    waiting = SimpleNamespace(reason=reason, message=message) if reason else None
+    cs = SimpleNamespace(
+        name="ncps",
+        ready=False,
+        restart_count=restarts,
+        state=SimpleNamespace(waiting=waiting),
+    )
+    status = SimpleNamespace(phase="Pending", container_statuses=[])
+    if init:
+        status.init_container_statuses = [cs]
+    else:
+        status.container_statuses = [cs]
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name="ncps-0", uid="a", resource_version="1"),
+        status=status,
+    )
+
+
+def test_fatal_container_state_flags_unrecoverable_waits():
+    problem = pod_readiness.fatal_container_state(
+        _waiting_pod("ImagePullBackOff", message="not found")
+    )
+    assert problem == "ncps-0/ncps: ImagePullBackOff - not found"
+    assert pod_readiness.fatal_container_state(
+        _waiting_pod("CreateContainerConfigError", init=True)
+    )
+
+
+def test_fatal_container_state_tolerates_transient_states():
+    assert pod_readiness.fatal_container_state(_waiting_pod(None)) is None
+    assert pod_readiness.fatal_container_state(_waiting_pod("ContainerCreating")) is None
+    crash = pod_readiness.CRASH_LOOP_RESTARTS
+    assert (
+        pod_readiness.fatal_container_state(
+            _waiting_pod("CrashLoopBackOff", restarts=crash - 1)
+        )
+        is None
+    )
+    assert pod_readiness.fatal_container_state(
+        _waiting_pod("CrashLoopBackOff", restarts=crash)
+    )
@@ -0,0 +1,92 @@
+"""Unit tests for the exponential-backoff poll helper.
+
+``sleep`` and ``clock`` are injected with a fake clock, so these run instantly
+under the pytest-only ``e2e-harness-unit`` check.
+"""
+
+from __future__ import annotations
+
+import socket
+
+import pytest
+
+import polling
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, s: float) -> None:
+        self.sleeps.append(s)
+        self.now += s
+
+
+def test_returns_first_truthy_result_without_sleeping():
+    fake = _FakeClock()
+    out = polling.poll(lambda: "ready", sleep=fake.sleep, clock=fake.clock)
+    assert out == "ready"
+    assert fake.sleeps == []
+
+
+def test_backoff_grows_geometrically_up_to_cap():
+    fake = _FakeClock()
+    results = iter([False] * 6 + [True])
+    out = polling.poll(
+        lambda: next(results),
+        initial=1.0,
+        mult=2.0,
+        cap=5.0,
+        budget=100.0,
+        sleep=fake.sleep,
+        clock=fake.clock,
+    )
+    assert out is True
+    assert fake.sleeps == [1.0, 2.0, 4.0, 5.0, 5.0, 5.0]
+
+
+def test_gives_up_at_budget_without_oversleeping():
+    fake = _FakeClock()
+    calls = {"n": 0}
+
+    def never():
+        calls["n"] += 1
+        return None
+
+    out = polling.poll(
+        never, initial=1.0, mult=2.0, cap=4.0, budget=6.0, sleep=fake.sleep, clock=fake.clock
+    )
+    assert out is None
+    assert fake.now == pytest.approx(6.0)
+    assert fake.sleeps == [1.0, 2.0, 3.0]
+    # One check per sleep, plus the final check at the deadline.
+    assert calls["n"] == 4
+
+
+def test_exceptions_propagate():
+    def boom():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        polling.poll(boom, sleep=lambda _s: None)
+
+
+def test_wait_for_port_returns_once_listening():
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        assert polling.wait_for_port(server.getsockname()[1], budget=1.0)
+
+
+def test_wait_for_port_gives_up_on_closed_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    fake = _FakeClock()
+    assert not polling.wait_for_port(port, budget=1.0, sleep=fake.sleep, clock=fake.clock)
+    assert fake.sleeps[0] == 0.02
+    assert max(fake.sleeps) <= 0.25
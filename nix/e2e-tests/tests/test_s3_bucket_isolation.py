@@ -12,7 +12,7 @@ from __future__ import annotations
 
 # harness_config is stdlib-only, so this runs in the pytest-only unit net
 # (which has neither requests nor pyyaml, so k8s_tests cannot be imported here).
-from harness_config import scenario_bucket_name
+from harness_config import scenario_bucket_name, scenario_database_name
 
 
 def test_scenario_bucket_name_is_per_scenario():
@@ -34,3 +34,7 @@ def test_scenario_bucket_names_are_valid_s3_names():
         assert bucket.islower()
         assert "_" not in bucket
         assert 3 <= len(bucket) <= 63
+
+
+def test_scenario_database_name_is_a_bare_sql_identifier():
+    assert scenario_database_name("single-s3-postgres-cdc") == "ncps_single_s3_postgres_cdc"
@@ -0,0 +1,50 @@
+"""Unit tests for per-thread stdout capture.
+
+``sys.stdout`` is swapped for a ``StringIO`` via ``monkeypatch`` so the routing
+stand-in installed by ``captured_stdout`` is torn down after each test.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+
+from thread_output import captured_stdout
+
+
+def test_capture_collects_only_the_current_threads_output(monkeypatch):
+    real = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", real)
+
+    with captured_stdout() as buf:
+        print("captured")
+    print("passed through")
+
+    assert buf.getvalue() == "captured\n"
+    assert real.getvalue() == "passed through\n"
+
+
+def test_concurrent_threads_do_not_interleave(monkeypatch):
+    real = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", real)
+    barrier = threading.Barrier(2)
+    outputs = {}
+
+    def worker(name):
+        with captured_stdout() as buf:
+            for i in range(50):
+                if i == 25:
+                    barrier.wait()
+                print(f"{name}-{i}")
+        outputs[name] = buf.getvalue()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for name in ("a", "b"):
+        assert outputs[name] == "".join(f"{name}-{i}\n" for i in range(50))
+    assert real.getvalue() == ""